@@ -1,32 +1,65 @@
 """"""
 
-from .goal_oriented_blinds import GoalOrientedBlindAlgorithm
+from typing import Hashable, Iterable
+
+from .goal_oriented_best_first import GOBestFirstSearch
 from ..fw import GoalOrientedStateSpace, State
 
-class GOAStar(GoalOrientedBlindAlgorithm):
+class GOAStar(GOBestFirstSearch):
     """"""
 
     __ALGO_NAME = "Goal-Oriented A*"
 
     def __init__(self, state_space: GoalOrientedStateSpace,
                  algo_name: str = __ALGO_NAME):
-        GoalOrientedBlindAlgorithm.__init__(self, algo_name, state_space)
+        GOBestFirstSearch.__init__(self, state_space, algo_name)
+
+        """The lowest depth (length of the path from the initial state) each
+        of the seen states was reached in, by their signatures. A state is
+        added to the fringe only when it was reached by a shorter path than
+        ever before; the entries of the longer paths left in the fringe are
+        outdated and they are skipped when popped."""
+        self._best_depths: dict[Hashable, int] = {}
+        signature = state_space.initial_state.signature()
+        if signature is not None:
+            self._best_depths[signature] = 0
 
     def _further_state_evaluation(self, state: State) -> float:
-        """"""
-        return (self.difference_from_goal(state) +
-                len(state.parents_sequence))
+        """A* adds the length of the path from the initial state to the
+        difference from the goal."""
+        return self.difference_from_goal(state) + state.depth
 
-    @property
-    def next_from_fringe(self) -> State:
-        """"""
-        lowest_state = 0
-        lowest_val = self._further_state_evaluation(self.fringe[0])
-        for index, state in enumerate(self.fringe[1:]):
-            if self._further_state_evaluation(state) <= lowest_val:
-                lowest_state = index
-        return self._fringe.pop(lowest_state)
+    def _is_outdated(self, state: State) -> bool:
+        """Returns if the given state was reached by a shorter path already."""
+        best_depth = self._best_depths.get(state.signature())
+        return best_depth is not None and state.depth > best_depth
 
+    def pop_from_fringe(self) -> State:
+        """Pops another state from the fringe, skipping the outdated ones.
+        The last state in the fringe is returned anyway; its better equivalent
+        has been closed already, so it's skipped as the closed one."""
+        state = GOBestFirstSearch.pop_from_fringe(self)
+        while self.has_any_in_fringe and self._is_outdated(state):
+            state = GOBestFirstSearch.pop_from_fringe(self)
+        return state
 
+    def safe_add_all_to_fringe(self, states: Iterable[State]):
+        """Adds the given states to the fringe only when they are reached
+        by a shorter path than any of their equivalents before (and they are
+        not closed). The states without the signature are added iff their
+        equivalents are not in the fringe."""
+        best_depths = self._best_depths
+        for state in states:
+            signature = state.signature()
+            if signature is None:
+                self.safe_add_to_fringe(state)
+                continue
 
+            best_depth = best_depths.get(signature)
+            if best_depth is not None and state.depth >= best_depth:
+                continue
+            if signature in self._closed_signatures:
+                continue
 
+            best_depths[signature] = state.depth
+            self.add_to_fringe(state)
@@ -1,7 +1,8 @@
 """"""
 
 from .goal_oriented_blinds import GoalOrientedBlindAlgorithm
-from ..fw import GoalOrientedStateSpace, State
+from ..fw import (GoalOrientedStateSpace, State, PriorityQueue,
+                  BucketPriorityQueue, HeapPriorityQueue)
 
 
 class GOBestFirstSearch(GoalOrientedBlindAlgorithm):
@@ -13,16 +14,37 @@ class GOBestFirstSearch(GoalOrientedBlindAlgorithm):
                  algo_name: str = __ALGO_NAME):
         GoalOrientedBlindAlgorithm.__init__(self, algo_name, state_space)
 
+    def _create_fringe(self) -> PriorityQueue:
+        """The fringe is held as a priority queue ordered by the evaluation,
+        which is calculated only once when the state is added. When the
+        evaluator declares integer differences, it's a bucket queue, which is
+        the fastest one for them; it's replaced by a heap once any evaluation
+        turns out not to be an integer anyway."""
+        if self.state_space.difference_evaluator.integer_differences:
+            return BucketPriorityQueue()
+        return HeapPriorityQueue()
+
+    def _further_state_evaluation(self, state: State) -> float:
+        """Evaluation of the state the fringe is ordered by; the lower the
+        better. Best-first search uses the difference from the goal only."""
+        return self.difference_from_goal(state)
+
+    def _push_to_fringe(self, state: State):
+        """Pushes the given state to the fringe queue by its evaluation."""
+        evaluation = self._further_state_evaluation(state)
+        try:
+            self._fringe.push(evaluation, state)
+        except TypeError:
+            # The evaluation is no (small enough) bucket index; use the heap
+            self._fringe = HeapPriorityQueue(self._fringe.entries())
+            self._fringe.push(evaluation, state)
+
+    def _push_all_to_fringe(self, states: list[State]):
+        """Pushes the given states to the fringe queue one by one."""
+        for state in states:
+            self._push_to_fringe(state)
+
     @property
     def next_from_fringe(self) -> State:
-        """"""
-        lowest_state = 0
-        lowest_val = self.difference_from_goal(self.fringe[lowest_state])
-        for index, state in enumerate(self.fringe[1:]):
-            if self.difference_from_goal(state) < lowest_val:
-                lowest_state = index
-        return self._fringe.pop(lowest_state)
-
-
-
-
+        """Pops the state with the lowest evaluation from the fringe."""
+        return self._fringe.pop()
@@ -1,5 +1,7 @@
 """"""
 
+from collections import deque
+
 from .goal_oriented_blinds import GoalOrientedBlindAlgorithm
 from ..fw import GoalOrientedStateSpace, State
 
@@ -13,10 +15,11 @@ class GOBFS(GoalOrientedBlindAlgorithm):
                  algo_name: str = __ALGO_NAME):
         GoalOrientedBlindAlgorithm.__init__(self, algo_name, state_space)
 
+    def _create_fringe(self) -> deque[State]:
+        """The fringe is a queue; popping from its start is O(1) in deque."""
+        return deque()
+
     @property
     def next_from_fringe(self) -> State:
         """"""
-        return self._fringe.pop(0)
-
-
-
+        return self._fringe.popleft()
@@ -9,8 +9,8 @@ class GoalOrientedBlindAlgorithm(FringeBasedAlgorithm, GoalBasedAlgorithm):
 
     def __init__(self, algo_name: str, state_space: GoalOrientedStateSpace,
                  minimize_accesses: bool = True):
-        FringeBasedAlgorithm.__init__(self, algo_name, state_space)
-        GoalBasedAlgorithm.__init__(self, algo_name, state_space)
+        # Cooperative initialization; the base Algorithm is initialized once
+        super().__init__(algo_name, state_space)
         self._minimize_accesses = minimize_accesses
 
     @property
@@ -27,14 +27,14 @@ class GoalOrientedBlindAlgorithm(FringeBasedAlgorithm, GoalBasedAlgorithm):
         if self.state_space.init_goal_equality:
             raise SolutionSuccess(self, self.state_space.initial_state)
 
-        # Save all the operators
-        all_ops = self.state_space.operators
+        # Expansion of a state to its children (done by the state space)
+        expand = self.state_space.expand
 
         # While the list of states to be searched is not emtpy
         while self.has_any_in_fringe:
 
             # Pick another from the fringe
-            current_state = self.next_from_fringe
+            current_state = self.pop_from_fringe()
 
             """If the algorithm should minimize the accesses, the current
             state is checked by the algorithm if it wasn't searched in 
@@ -44,14 +44,13 @@ class GoalOrientedBlindAlgorithm(FringeBasedAlgorithm, GoalBasedAlgorithm):
                 continue
 
             else:
-                # Get list of all the children states
-                children = current_state.apply_all(
-                    current_state.filter_applicable(all_ops))
+                # Get all the children states (by the applicable ops only)
+                children = expand(current_state)
 
                 # Check if any of the child nodes is equivalent to goal one
-                for child_node in children:
-                    if self.difference_from_goal(child_node) == 0:
-                        raise SolutionSuccess(self, child_node)
+                goal_node = self.find_goal(children)
+                if goal_node is not None:
+                    raise SolutionSuccess(self, goal_node)
 
                 """If the algorithm should filter only newly visited 
                 children or not. Similarly if the current state should 
@@ -1,7 +1,8 @@
 """"""
 
 from .goal_oriented_blinds import GoalOrientedBlindAlgorithm
-from ..fw import GoalOrientedStateSpace, State, SolutionSuccess
+from ..fw import (GoalOrientedStateSpace, State, SolutionSuccess,
+                  SolutionFailure)
 
 
 class GOIDDFS(GoalOrientedBlindAlgorithm):
@@ -27,8 +28,8 @@ class GOIDDFS(GoalOrientedBlindAlgorithm):
     def solve(self):
         """"""
 
-        # Save all the operators
-        all_ops = self.state_space.operators
+        # Expansion of a state to its children (done by the state space)
+        expand = self.state_space.expand
 
         # Current depth
         current_depth = 0
@@ -36,21 +37,17 @@ class GOIDDFS(GoalOrientedBlindAlgorithm):
         # Nodes deeper than current increment
         deeper_nodes: list[State] = []
 
-        # Iterate to infinity
+        # Iterate until the solution is found or there is nothing deeper
         while True:
 
             # Increasing the limit depth
             current_depth = current_depth + self.depth_increment
 
-            # Adds a first line after the limit and purify the list
-            self.safe_add_all_to_fringe(deeper_nodes)
-            deeper_nodes.clear()
-
             # While the list of states to be searched is not emtpy
             while self.has_any_in_fringe:
 
                 # Pick another from the fringe
-                current_state = self.next_from_fringe
+                current_state = self.pop_from_fringe()
 
                 """If the algorithm should minimize the accesses, the current
                 state is checked by the algorithm if it wasn't searched in 
@@ -60,13 +57,12 @@ class GOIDDFS(GoalOrientedBlindAlgorithm):
                     continue
 
                 # If it isn't equal to the goal state
-                elif self.difference_from_goal(current_state) > 0:
+                elif not self.is_goal(current_state):
 
-                    # Get list of all the children states
-                    children = current_state.apply_all(
-                        current_state.filter_applicable(all_ops))
+                    # Get all the children states (by the applicable ops only)
+                    children = expand(current_state)
 
-                    if len(current_state.parents_sequence)-1 >= current_depth:
+                    if current_state.depth >= current_depth:
                         """If the current state is on the edge of the limit"""
                         deeper_nodes.extend(children)
 
@@ -86,9 +82,19 @@ class GOIDDFS(GoalOrientedBlindAlgorithm):
                 else:
                     raise SolutionSuccess(self, current_state)
 
-            # The solution cannot be reached; all accessible states were searched
-            #raise SolutionFailure(
-            #    "All states were searched and no suitable result was found", self)
+            """The solution cannot be reached; all accessible states were
+            searched. Without this check the loop would never end on a finite
+            state space."""
+            if not deeper_nodes:
+                raise SolutionFailure(
+                    "All states were searched and no suitable result was "
+                    "found", self)
+
+            """The fringe is exhausted; the states after the limit follow.
+            The same state is often reached from more of the parents on the
+            limit, so the equivalent ones are added only once."""
+            self.safe_add_all_to_fringe(deeper_nodes)
+            deeper_nodes = []
 
 
     @property
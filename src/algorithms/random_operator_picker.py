@@ -1,15 +1,19 @@
 """"""
 
-from random import choice
+from random import Random
 from ..fw import GoalOrientedStateSpace, GoalBasedAlgorithm, SolutionSuccess
 
 
 class RandomOperatorPicker(GoalBasedAlgorithm):
 
-    def __init__(self, state_space: GoalOrientedStateSpace):
+    def __init__(self, state_space: GoalOrientedStateSpace,
+                 rng: Random = None):
         GoalBasedAlgorithm.__init__(self, "RandomOperatorPicker", state_space)
         self._number_of_seen = 0
 
+        # Own generator of random numbers; can be given seeded for replays
+        self._rng = rng if rng is not None else Random()
+
     @property
     def number_of_seen(self) -> int:
         """"""
@@ -17,29 +21,34 @@ class RandomOperatorPicker(GoalBasedAlgorithm):
 
     def solve(self):
 
-        # All operators available
-        ops = self.state_space.operators
+        # Operators applicable on a state (filtered by the state space)
+        applicable_operators = self.state_space.applicable_operators
+
+        # Bound picking method of the generator (looked up only once)
+        choice = self._rng.choice
+
+        # Goal test of the state space (looked up only once)
+        is_goal = self.state_space.is_goal
 
         # Current state the space is in
         current_state = self.state_space.initial_state
 
         # While there is difference between the current state and the goal
-        while self.state_space.difference_from_goal(current_state) > 0:
+        while not is_goal(current_state):
 
             # Filter available operators only
-            applicable_operators = current_state.filter_applicable(ops)
+            applicable = applicable_operators(current_state)
 
             # Save the number of potential children ('seen' states)
-            self._number_of_seen += len(applicable_operators)
+            self._number_of_seen += len(applicable)
 
             # Randomly pick available operator
-            applying = choice(applicable_operators)
+            applying = choice(applicable)
 
-            # Apply this operator to current state and save the result
-            current_state = current_state.apply(applying)
+            """Apply this operator to current state and save the result. The
+            operator is known to be applicable, so it is applied directly
+            without checking it again."""
+            current_state = applying.apply_on(current_state)
 
         # If the difference is zero
         raise SolutionSuccess(self, current_state)
-
-
-
@@ -4,9 +4,11 @@ protocols of the states, state spaces and algorithms."""
 # Package-initor shorthand import index
 from .algorithm import (
     Algorithm, FringeBasedAlgorithm, GoalBasedAlgorithm, AlgorithmTermination,
-    SolutionSuccess, SolutionFailure)
+    SolutionSuccess, SolutionFailure, SearchResult, StatesView)
 
 from .state import State, Operator, DifferenceEvaluator
 
 from .state_space import StateSpace, GoalOrientedStateSpace, StateSpaceShuffle
 
+from .priority_queues import (
+    PriorityQueue, HeapPriorityQueue, BucketPriorityQueue)
@@ -1,10 +1,13 @@
 """"""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from collections import OrderedDict
+from collections.abc import Sequence
+from itertools import repeat
+from typing import Iterable, Iterator, Hashable
 from time import time
 
-from .state import State
+from .state import State, Operator
 from .state_space import StateSpace, GoalOrientedStateSpace
 
 
@@ -33,6 +36,9 @@ class Algorithm(ABC):
         self._algo_name = algo_name
         self._state_space = state_space
 
+        # Operators of the state space; taken once for the whole run
+        self._operators = state_space.operators
+
         # When the timer started
         self.__timer_start = 1
 
@@ -49,6 +55,11 @@ class Algorithm(ABC):
         """State space in which the solution has to be found."""
         return self._state_space
 
+    @property
+    def operators(self) -> tuple[Operator]:
+        """Operators of the state space the algorithm searches in."""
+        return self._operators
+
     @property
     def ran_for(self) -> float:
         """Algorithm measures it's period of time it ran. This value is in
@@ -87,6 +98,29 @@ class Algorithm(ABC):
             self.stop_timer()
             raise e
 
+    def search(self) -> "SearchResult":
+        """Runs the algorithm (like calling the instance does) and returns
+        the way it terminated as a `SearchResult` instead of raising it. It's
+        the entry point for the callers that don't want to catch the
+        termination exceptions.
+
+        Returns
+        -------
+        SearchResult
+            Result of the run; successful with the final state found or
+            unsuccessful with the message about the failure.
+        """
+        self.start_timer()
+        try:
+            self.solve()
+        except AlgorithmTermination as termination:
+            return SearchResult(termination)
+        finally:
+            self.stop_timer()
+
+        # The algorithm has to terminate by one of the exceptions
+        raise Exception(f"{self.algorithm_name}: Ended without termination")
+
     @abstractmethod
     def solve(self):
         """Abstract method `solve` responsible for performing the actual
@@ -132,27 +166,42 @@ class FringeBasedAlgorithm(Algorithm):
             State space to be used as an abstraction of the problem to be
             solved.
         """
-        Algorithm.__init__(self, algo_name, state_space)
-        self._fringe: list[State] = [state_space.initial_state]
+        super().__init__(algo_name, state_space)
+        self._fringe = self._create_fringe()
+        self._push_to_fringe(state_space.initial_state)
         self._closed: list[State] = []
         self._number_of_seen: int = 1
 
+        """Indexes of signatures of the states contained in the fringe (with
+        the number of their occurrences) and in the closed. These are used
+        to test the membership of the states providing a signature by hash
+        lookup instead of walking through the whole collection."""
+        self._fringe_signatures: dict[Hashable, int] = {}
+        self._closed_signatures: set[Hashable] = set()
+        self._index_in_fringe(state_space.initial_state)
+
     @property
-    def fringe(self) -> tuple[State]:
+    def fringe(self) -> "StatesView":
         """'Fringe' is list of states that are about to be searched for paths
         to the desired state.
 
-        This property returns these states contained in a tuple collection."""
-        return tuple(self._fringe)
+        This property returns a read-only view of these states. The view is
+        live (it reflects the further changes of the fringe) and it costs no
+        copy; use `tuple(algorithm.fringe)` for a snapshot. The algorithms
+        deleting the states from the fringe lazily (like A*) may have there
+        also the outdated states, which are skipped when popped."""
+        return StatesView(self._fringe)
 
     @property
-    def closed(self) -> tuple[State]:
+    def closed(self) -> "StatesView":
         """'Closed' is list of states, to which all possible operators were
         already applied and further searching in them cannot contribute to
         the solution anymore.
 
-        This property returns these states contained in a tuple collection."""
-        return tuple(self._closed)
+        This property returns a read-only view of these states. The view is
+        live (it reflects the further changes of the closed) and it costs no
+        copy; use `tuple(algorithm.closed)` for a snapshot."""
+        return StatesView(self._closed)
 
     @property
     def number_of_seen(self) -> int:
@@ -165,23 +214,29 @@ class FringeBasedAlgorithm(Algorithm):
     def has_any_in_fringe(self) -> bool:
         """Returns if the fringe has any state in it. If does, it return True,
         else False."""
-        return len(self.fringe) > 0
+        return len(self._fringe) > 0
 
     @property
     def has_any_in_closed(self) -> bool:
         """Returns if the closed has any state in it. If does, it returns True,
         else False."""
-        return len(self.closed) > 0
+        return len(self._closed) > 0
 
     def is_in_fringe(self, state: State) -> bool:
         """Method returning if the given state (or it's equivalent with zero
         difference) is already contained in the fringe."""
-        return self._is_in(state, self.fringe)
+        signature = state.signature()
+        if signature is None:
+            return self._is_in(state, self._fringe)
+        return signature in self._fringe_signatures
 
     def is_in_closed(self, state: State) -> bool:
         """Method returning if the given state (or it's equivalent with zero
         difference) is already contained in the list of closed states."""
-        return self._is_in(state, self.closed)
+        signature = state.signature()
+        if signature is None:
+            return self._is_in(state, self._closed)
+        return signature in self._closed_signatures
 
     def _is_in(self, state: State, container: Iterable[State]) -> bool:
         """Private method responsible for search in the given container for
@@ -189,20 +244,60 @@ class FringeBasedAlgorithm(Algorithm):
 
         If there is such a state, it means the two states are equal in means
         of state space abstraction, therefore the state is contained.
+
+        The whole container is compared in one batch, the loop runs in `any`
+        and stops at the first state with zero difference.
         """
-        # For each state in the given container of states
-        for s in container:
+        are_the_same = self.state_space.difference_evaluator.are_the_same
+        return any(map(are_the_same, container, repeat(state)))
+
+    def _index_in_fringe(self, state: State):
+        """Registers the signature of the given state (if it provides any)
+        as the one contained in the fringe."""
+        signature = state.signature()
+        if signature is not None:
+            self._fringe_signatures[signature] = (
+                self._fringe_signatures.get(signature, 0) + 1)
+
+    def _unindex_from_fringe(self, state: State):
+        """Unregisters one occurrence of the signature of the given state
+        (if it provides any) from the fringe."""
+        signature = state.signature()
+        if signature is not None:
+            remaining = self._fringe_signatures[signature] - 1
+            if remaining > 0:
+                self._fringe_signatures[signature] = remaining
+            else:
+                del self._fringe_signatures[signature]
+
+    def _create_fringe(self) -> list[State]:
+        """Creates the empty container of the fringe. It's a list by default,
+        which is good for popping from its end; descendants needing another
+        kind of container (like a queue or a heap) override this."""
+        return []
+
+    def _push_to_fringe(self, state: State):
+        """Stores the given state in the fringe container. Descendants using
+        other kind of container than the list (like a heap) override this."""
+        self._fringe.append(state)
 
-            # If the difference between the states is equal to zero
-            if self.state_space.difference_evaluator.are_the_same(s, state):
-                return True
+    def _push_all_to_fringe(self, states: list[State]):
+        """Stores all the given states in the fringe container at once.
+        Descendants overriding `_push_to_fringe` have to override this too."""
+        self._fringe += states
 
-        # If none of the states has zero difference
-        return False
+    def pop_from_fringe(self) -> State:
+        """Removes another state from the fringe and returns it. The state is
+        picked by `next_from_fringe`. The algorithms should take the states
+        from the fringe by this method, so the fringe index stays valid."""
+        state = self.next_from_fringe
+        self._unindex_from_fringe(state)
+        return state
 
     def add_to_fringe(self, state: State):
         """Adds the given state on the end of the fringe."""
-        self._fringe.append(state)
+        self._push_to_fringe(state)
+        self._index_in_fringe(state)
         self._number_of_seen += 1
 
     def safe_add_to_fringe(self, state: State):
@@ -214,30 +309,56 @@ class FringeBasedAlgorithm(Algorithm):
     def add_all_to_fringe(self, states: Iterable[State]):
         """Adds all the given states to the fringe, no matter if their
         equivalents are there already."""
-        self._fringe.extend(states)
-        self._number_of_seen += len(tuple(states))
+        if not isinstance(states, list):
+            states = list(states)
+        self._push_all_to_fringe(states)
+        for state in states:
+            self._index_in_fringe(state)
+        self._number_of_seen += len(states)
 
     def safe_add_all_to_fringe(self, states: Iterable[State]):
         """Adds all the given states to fringe safely. It means the states
-        are checked if their equivalents are not there already."""
-        to_be_added = tuple(filter(lambda s: not self.is_in_fringe(s), states))
-        self.add_all_to_fringe(to_be_added)
-        self._number_of_seen += len(to_be_added)
+        are checked if their equivalents are not there already; the states
+        equivalent to each other are added only once too."""
+        is_in_fringe = self.is_in_fringe
+        added: list[State] = []
+        added_signatures: set[Hashable] = set()
+        for state in states:
+            signature = state.signature()
+            if signature is None:
+                if not is_in_fringe(state) and not self._is_in(state, added):
+                    added.append(state)
+            elif (signature not in added_signatures
+                  and signature not in self._fringe_signatures):
+                added_signatures.add(signature)
+                added.append(state)
+        self.add_all_to_fringe(added)
 
     def add_to_closed(self, state: State):
         """Adds the given state on the end of the fringe"""
         self._closed.append(state)
+        signature = state.signature()
+        if signature is not None:
+            self._closed_signatures.add(signature)
 
     def safe_add_to_closed(self, state: State):
         """Adds the given state on the end of the closed; iff the state is not
         there already."""
-        if not self.is_in_closed(state):
+        signature = state.signature()
+        if signature is None:
+            if not self._is_in(state, self._closed):
+                self._closed.append(state)
+
+        # Single lookup in the set of the signatures of the closed states
+        elif signature not in self._closed_signatures:
+            self._closed_signatures.add(signature)
             self._closed.append(state)
 
     def add_all_to_closed(self, states: Iterable[State]):
         """Adds all the given states to the closed, no matter if their
         equivalents are there already."""
-        self._closed.extend(states)
+        for state in states:
+            self.add_to_closed(state)
 
     def safe_add_all_to_closed(self, states: Iterable[State]):
         """Adds all the given states to closed safely. It means the states
@@ -261,6 +382,49 @@ class FringeBasedAlgorithm(Algorithm):
         """
 
 
+class StatesView(Sequence):
+    """Read-only view of a collection of states held by an algorithm (like
+    its fringe or closed). It's a sequence, so it can be iterated, measured
+    and indexed like the tuples returned before, but it provides no way of
+    changing the collection.
+
+    Containers that cannot be indexed (like the priority queues) are copied
+    into a tuple for each indexing."""
+
+    __slots__ = ("_states",)
+
+    def __init__(self, states: Iterable[State]):
+        """Initor of the view.
+
+        Parameters
+        ----------
+        states : Iterable of State
+            The viewed collection of states; it has to provide its length.
+        """
+        self._states = states
+
+    def __getitem__(self, index):
+        try:
+            return self._states[index]
+        except TypeError:
+            return tuple(self._states)[index]
+
+    def __iter__(self) -> Iterator[State]:
+        return iter(self._states)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __eq__(self, other):
+        """Views are equal to the tuples (or views) of the same states."""
+        if isinstance(other, StatesView):
+            other = tuple(other)
+        return tuple(self._states) == other
+
+    def __repr__(self):
+        return f"{type(self).__name__}({tuple(self._states)})"
+
+
 class GoalBasedAlgorithm(Algorithm):
     """This abstract class of algorithms provides ability to consider the
     goal as an important part of information when solving the problem. Usually
@@ -268,6 +432,9 @@ class GoalBasedAlgorithm(Algorithm):
     and if the algorithm achieved what it had to or not.
     """
 
+    # Maximal number of the differences from the goal cached by signatures
+    __MAX_CACHED_DIFFERENCES = 1_000_000
+
     def __init__(self, algo_name: str, state_space: GoalOrientedStateSpace):
         """Initor of the class. It provides creation of the instance of
         `Algorithm`, that can solve problems in state space.
@@ -281,25 +448,40 @@ class GoalBasedAlgorithm(Algorithm):
             State space to be used as an abstraction of the problem to be
             solved.
         """
-        Algorithm.__init__(self, algo_name, state_space)
+        super().__init__(algo_name, state_space)
+
+        """Differences from the goal by the signatures of the evaluated states
+        and the goal and the evaluator they were evaluated by. Equivalent
+        states reached by different paths share the evaluation this way."""
+        self._differences: OrderedDict[Hashable, float] = OrderedDict()
+        self._differences_goal = state_space.goal_state
+        self._differences_evaluator = state_space.difference_evaluator
 
     @property
     def state_space(self) -> GoalOrientedStateSpace:
         """Overrides the original `state_space` property by changing the
         return value type to `GoalOrientedStateSpace`."""
         # The state space of the correct type is set by initor
-        return super().state_space
+        return self._state_space
 
     @property
     def goal_state(self) -> State:
         """This property returns the goal state from the Goal-oriented state
         space. It's just a short hand for cleaning the usage."""
-        return self.state_space.goal_state
+        return self._state_space.goal_state
 
     def difference_from_goal(self, state: State) -> float:
         """This method provides easier usage by delegating the evaluation
         on the goal-oriented state space's difference evaluator.
 
+        The difference memoized on the state (see
+        `GoalOrientedStateSpace.difference_from_goal`) is used first. The
+        evaluations of the states providing a signature are cached by the
+        signature too, so each of the equivalent states is evaluated only
+        once. The least recently used evaluation is evicted when the cache
+        reaches its maximal size; the cache is emptied when the goal state or
+        the difference evaluator of the state space is replaced.
+
         Parameters
         ----------
         state : State
@@ -313,7 +495,54 @@ class GoalBasedAlgorithm(Algorithm):
             The result of the evaluation; the quantified difference (distance)
             between the given state and the goal one.
         """
-        return self.state_space.difference_from_goal(state)
+        # The state space is read directly; this is called for every state
+        state_space = self._state_space
+        goal_state = state_space._goal_state
+        evaluator = state_space._diff_evaluator
+
+        # The difference memoized on the state itself costs no hashing
+        memo = state._goal_difference
+        if (memo is not None and memo[0] is goal_state
+                and memo[1] is evaluator):
+            return memo[2]
+
+        signature = state.signature()
+        if signature is None:
+            return state_space.difference_from_goal(state)
+
+        differences = self._differences
+        if (goal_state is not self._differences_goal
+                or evaluator is not self._differences_evaluator):
+            differences.clear()
+            self._differences_goal = goal_state
+            self._differences_evaluator = evaluator
+
+        difference = differences.get(signature)
+        if difference is None:
+            difference = state_space.difference_from_goal(state)
+            differences[signature] = difference
+
+            # The least recently used difference is evicted
+            if len(differences) > self.__MAX_CACHED_DIFFERENCES:
+                differences.popitem(last=False)
+        else:
+            differences.move_to_end(signature)
+
+            """The difference is memoized on the state too, so its children
+            can derive their differences from it (see the evaluators)."""
+            state._goal_difference = (goal_state, evaluator, difference)
+        return difference
+
+    def is_goal(self, state: State) -> bool:
+        """Shorthand for the goal test of the goal-oriented state space. It
+        returns True if the given state is equivalent to the goal state."""
+        return self._state_space.is_goal(state)
+
+    def find_goal(self, states: Iterable[State]) -> State:
+        """Shorthand for the batch goal test of the goal-oriented state space.
+        It returns the first of the given states equivalent to the goal state
+        or None."""
+        return self._state_space.find_goal(states)
 
 
 class AlgorithmTermination(Exception):
@@ -407,4 +636,66 @@ class SolutionFailure(AlgorithmTermination):
             self, f"{algorithm.algorithm_name}: {message}", algorithm)
 
 
+class SearchResult:
+    """Instances of this class describe how the algorithm run terminated. It's
+    the return value counterpart of the termination exceptions, returned by
+    `Algorithm.search`."""
+
+    def __init__(self, termination: AlgorithmTermination):
+        """Initor of the result.
+
+        Parameters
+        ----------
+        termination : AlgorithmTermination
+            The exception the algorithm terminated by; either
+            `SolutionSuccess` or `SolutionFailure`.
+        """
+        self._termination = termination
+
+    @property
+    def termination(self) -> AlgorithmTermination:
+        """The exception the algorithm terminated by."""
+        return self._termination
+
+    @property
+    def algorithm(self) -> Algorithm:
+        """Algorithm that just ended."""
+        return self._termination.algorithm
+
+    @property
+    def success(self) -> bool:
+        """Returns if the solution was found."""
+        return isinstance(self._termination, SolutionSuccess)
+
+    @property
+    def message(self) -> str:
+        """Description of algorithm termination."""
+        return self._termination.message
+
+    @property
+    def final_state(self) -> State:
+        """Returns the found solution or None, when there is no one."""
+        if self.success:
+            return self._termination.final_state
+        return None
+
+    def raise_termination(self):
+        """Raises the termination exception of this result, for the callers
+        expecting the termination by the exceptions.
+
+        Raises
+        ------
+        SolutionSuccess
+            When the solution was found
+
+        SolutionFailure
+            When the solution was not found
+        """
+        raise self._termination
+
+    def __bool__(self) -> bool:
+        """The result is truthy iff the solution was found."""
+        return self.success
+
+
 
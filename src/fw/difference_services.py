@@ -18,7 +18,27 @@ distance definition:
 """
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from math import dist
+from operator import ne, sub
+from typing import Iterable, Sequence
+
+
+def _binary_bit_count(number: int) -> int:
+    """Number of the set bits of the given non-negative integer counted from
+    its binary representation."""
+    return bin(number).count("1")
+
+
+# Population count; `int.bit_count` is available since Python 3.10 only
+_bit_count = getattr(int, "bit_count", _binary_bit_count)
+
+
+def _as_sequence(vector: Iterable) -> Sequence:
+    """Returns the given vector as a sequence with known length. Tuples and
+    lists are returned as they are, other iterables are copied in a tuple."""
+    if isinstance(vector, (tuple, list)):
+        return vector
+    return tuple(vector)
 
 
 class DistanceService(ABC):
@@ -27,6 +47,8 @@ class DistanceService(ABC):
     This functionality is defined by the implementation of abstract method
     'evaluate' by the descendants of this class."""
 
+    __slots__ = ()
+
     @abstractmethod
     def evaluate(self, state1, state2) -> float:
         """This abstract method sets the most general protocol of the
@@ -37,6 +59,25 @@ class DistanceService(ABC):
 
         The returned value is always of type 'float'."""
 
+    def are_the_same(self, state1: Iterable, state2: Iterable) -> bool:
+        """Returns if the distance between the two given states is equal to
+        zero (0). By the definition of distance (3) it's iff the two vectors
+        are equal, so they are just compared, which stops at the first
+        different dimension instead of evaluating the whole distance. The
+        vectors of different dimensions cannot be compared, the same as by
+        the evaluation."""
+        state1 = _as_sequence(state1)
+        state2 = _as_sequence(state2)
+
+        # If the lengths are not the same
+        if len(state1) != len(state2):
+            raise Exception(
+                "Cannot compare two states of different dimensions")
+
+        if type(state1) is not type(state2):
+            return tuple(state1) == tuple(state2)
+        return state1 == state2
+
 
 class HammingDistance(DistanceService):
     """Hamming distance is distance between two equally sized and ordered sets,
@@ -46,6 +87,8 @@ class HammingDistance(DistanceService):
     Further reading at: https://en.wikipedia.org/wiki/Hamming_distance
     """
 
+    __slots__ = ()
+
     def evaluate(self, state1: Iterable, state2: Iterable) -> float:
         """This evaluation returns the number of different elements. Both the
         items types in these iterables has to be comparable between each other.
@@ -60,30 +103,63 @@ class HammingDistance(DistanceService):
             Any iterable of a specified length that is the same as the other
             states'
         """
-        # Setting the two vectors in to tuples to get properties of sizeable
-        state1 = tuple(state1)
-        state2 = tuple(state2)
+        # Setting the two vectors in to sequences to get properties of sizeable
+        state1 = _as_sequence(state1)
+        state2 = _as_sequence(state2)
 
         # If the dimension of the two vectors is the same
         if len(state1) == len(state2):
 
-            # When the two vectors are equal, the diff is 0 (default)
-            total_difference = 0
+            # Count the positions, where the two values are not equal
+            return sum(map(ne, state1, state2))
+
+        # If the lengths are not the same
+        raise Exception("Cannot compare two states of different dimensions")
+
 
-            # For each dimension
-            for index, value in enumerate(state1):
+class BitHammingDistance(HammingDistance):
+    """Hamming distance of binary vectors packed in to integers (one bit per
+    dimension). The different dimensions are the set bits of `xor` of the two
+    integers, so they are all counted at once by a single population count
+    instead of comparing the dimensions one by one.
 
-                # If the two values at the position are not equal
-                if value != state2[index]:
+    Vectors of booleans (or of any zeroes and ones) can be packed by the
+    `pack` method.
+    """
 
-                    # Increase the difference by one
-                    total_difference += 1
+    __slots__ = ()
 
-            # Return the total difference between two vectors
-            return total_difference
+    @staticmethod
+    def pack(vector: Iterable) -> int:
+        """Packs the given binary vector in to an integer; the first
+        dimension becomes the lowest bit."""
+        packed = 0
+        for index, value in enumerate(vector):
+            if value:
+                packed |= 1 << index
+        return packed
 
-        # If the lengths are not the same
-        raise Exception("Cannot compare two states of different dimensions")
+    def evaluate(self, state1: int, state2: int) -> float:
+        """Returns the number of different bits of the two packed vectors.
+        Other vectors than integers are evaluated as by the Hamming distance.
+
+        Parameters
+        ----------
+        state1: int
+            Binary vector packed in to an integer
+
+        state2: int
+            Binary vector packed in to an integer
+        """
+        if isinstance(state1, int) and isinstance(state2, int):
+            return _bit_count(state1 ^ state2)
+        return HammingDistance.evaluate(self, state1, state2)
+
+    def are_the_same(self, state1: int, state2: int) -> bool:
+        """Packed vectors are the same iff the integers are equal."""
+        if isinstance(state1, int) and isinstance(state2, int):
+            return state1 == state2
+        return HammingDistance.are_the_same(self, state1, state2)
 
 
 class ManhattanDistance(DistanceService):
@@ -93,27 +169,22 @@ class ManhattanDistance(DistanceService):
     Further reading at: https://en.wikipedia.org/wiki/Taxicab_geometry.
     """
 
+    __slots__ = ()
+
     def evaluate(self, state1: Iterable[float],
                  state2: Iterable[float]) -> float:
         """The difference is evaluated as a sum of differences between two
         given vectors of float numbers. Both the vectors has to be with equal
         length (dimension), otherwise it cannot be calculated.
         """
-        state1 = tuple(state1)
-        state2 = tuple(state2)
+        state1 = _as_sequence(state1)
+        state2 = _as_sequence(state2)
 
         # If both states are the same dimension
         if len(state1) == len(state2):
-            total_difference = 0
-
-            # For each dimension in both states
-            for index, value in enumerate(state1):
 
-                # Add the abs difference between the states in the dimension
-                total_difference += abs(state2[index] - value)
-
-            # Return sum of the absolute differences
-            return total_difference
+            # Return sum of the absolute differences in each dimension
+            return sum(map(abs, map(sub, state2, state1)))
 
         # If the lengths are not the same
         raise Exception("Cannot compare two states of different dimensions")
@@ -122,21 +193,18 @@ class ManhattanDistance(DistanceService):
 class EuclideanDistance(DistanceService):
     """"""
 
+    __slots__ = ()
+
     def evaluate(self, state1: Iterable[float],
                  state2: Iterable[float]) -> float:
         """"""
-        state1 = tuple(state1)
-        state2 = tuple(state2)
+        state1 = _as_sequence(state1)
+        state2 = _as_sequence(state2)
 
         if len(state1) == len(state2):
-            total_difference = 0
-            for index, value in enumerate(state1):
-
-                # Make the difference in each dimension squared
-                total_difference += (state2[index] - value) ** 2
 
             # Return root of the sum of squared differences in each dimension
-            return total_difference ** 0.5
+            return dist(state1, state2)
 
         # If the lengths are not the same
         raise Exception("Cannot compare two states of different dimensions")
@@ -0,0 +1,175 @@
+"""This module contains priority queues the informed algorithms can hold their
+fringe in. All of them pop the item with the lowest priority first; the items
+with equal priority are popped in the order they were pushed in.
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from heapq import heappush, heappop, heappushpop
+from itertools import count
+from typing import Any, Iterable, Iterator
+
+
+class PriorityQueue(ABC):
+    """Abstract mutual parent of the priority queues. It defines the protocol
+    of pushing an item with its priority and popping the item with the lowest
+    priority."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def push(self, priority: float, item: Any):
+        """Adds the given item to the queue with the given priority."""
+
+    @abstractmethod
+    def pop(self) -> Any:
+        """Removes and returns the item with the lowest priority. When there
+        are more of them, the one pushed first is returned."""
+
+    @abstractmethod
+    def entries(self) -> Iterator[tuple[float, Any]]:
+        """Iterates over all the contained items with their priorities in
+        form of tuples `(priority, item)`, in the order of popping."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of the items contained."""
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over all the contained items (without the priorities),
+        not necessarily in the order of popping."""
+        return (item for _, item in self.entries())
+
+
+class HeapPriorityQueue(PriorityQueue):
+    """Priority queue backed by a binary heap. Both pushing and popping cost
+    O(log N). Priorities can be of any mutually comparable type.
+
+    The last pushed item is held aside until another push or pop. When
+    popped, it is merged with the heap by a single `heappushpop`, which
+    returns it right away (without any sift) when it's the lowest one; that
+    is common for the children of the state expanded just before."""
+
+    __slots__ = ("_heap", "_counter", "_pending")
+
+    def __init__(self, entries: Iterable[tuple[float, Any]] = ()):
+        """Initor of the queue.
+
+        Parameters
+        ----------
+        entries : Iterable of tuple
+            Tuples `(priority, item)` the queue should contain from the
+            beginning. Empty by default.
+        """
+        # Heap of tuples (priority, order, item); the order prevents the
+        # comparison of the items themselves
+        self._heap: list[tuple[float, int, Any]] = []
+        self._counter = count()
+
+        # The last pushed entry, not in the heap yet (or None)
+        self._pending: tuple[float, int, Any] = None
+
+        for priority, item in entries:
+            self.push(priority, item)
+
+    def push(self, priority: float, item: Any):
+        """Pushes the given item to the heap."""
+        if self._pending is not None:
+            heappush(self._heap, self._pending)
+        self._pending = (priority, next(self._counter), item)
+
+    def pop(self) -> Any:
+        """Pops the item with the lowest priority from the heap."""
+        if self._pending is None:
+            return heappop(self._heap)[2]
+        entry = heappushpop(self._heap, self._pending)
+        self._pending = None
+        return entry[2]
+
+    def _all_entries(self) -> list[tuple[float, int, Any]]:
+        """All the entries of the heap including the pending one."""
+        if self._pending is None:
+            return self._heap
+        return self._heap + [self._pending]
+
+    def entries(self) -> Iterator[tuple[float, Any]]:
+        """Iterates over the items with their priorities."""
+        return ((entry[0], entry[2]) for entry in sorted(self._all_entries()))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the items in the order of the heap, which spares
+        the sorting of the entries."""
+        return (entry[2] for entry in self._all_entries())
+
+    def __len__(self) -> int:
+        return len(self._heap) + (self._pending is not None)
+
+
+class BucketPriorityQueue(PriorityQueue):
+    """Priority queue keeping a bucket (FIFO queue) for every priority. It
+    accepts only non-negative integer priorities, which are the indexes of
+    the buckets; in exchange pushing costs O(1) and popping is amortized O(1)
+    when the popped priorities do not decrease much, like the evaluations in
+    A* do. Buckets are added on demand, up to the `MAX_PRIORITY`; higher
+    priorities are refused like the non-integer ones, so a single huge
+    priority cannot allocate a bucket for every integer below it.
+    """
+
+    __slots__ = ("_buckets", "_min_index", "_size")
+
+    # The highest priority the queue keeps a bucket for
+    MAX_PRIORITY = 4095
+
+    def __init__(self):
+        """Initor of the empty queue."""
+        self._buckets: list[deque] = []
+
+        # Index of the bucket below which all the buckets are empty
+        self._min_index = 0
+        self._size = 0
+
+    def push(self, priority: int, item: Any):
+        """Appends the given item to the bucket of its priority.
+
+        Raises
+        ------
+        TypeError
+            When the given priority is not a non-negative integer up to the
+            `MAX_PRIORITY`; the caller is expected to switch to another kind
+            of queue then.
+        """
+        if (not isinstance(priority, int) or priority < 0
+                or priority > self.MAX_PRIORITY):
+            raise TypeError(
+                f"Priority has to be a non-negative integer up to "
+                f"{self.MAX_PRIORITY}: {priority}")
+
+        # Add the buckets for the priorities not used yet
+        while len(self._buckets) <= priority:
+            self._buckets.append(deque())
+
+        self._buckets[priority].append(item)
+        self._size += 1
+        if priority < self._min_index:
+            self._min_index = priority
+
+    def pop(self) -> Any:
+        """Pops the first item from the lowest non-empty bucket."""
+        if self._size == 0:
+            raise IndexError("pop from an empty priority queue")
+
+        # Skip the empty buckets
+        while not self._buckets[self._min_index]:
+            self._min_index += 1
+
+        self._size -= 1
+        return self._buckets[self._min_index].popleft()
+
+    def entries(self) -> Iterator[tuple[int, Any]]:
+        """Iterates over the items with their priorities."""
+        for priority in range(self._min_index, len(self._buckets)):
+            for item in self._buckets[priority]:
+                yield priority, item
+
+    def __len__(self) -> int:
+        return self._size
@@ -6,12 +6,18 @@ and the critical means of the state space problem solutions.
 """
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from collections import deque
+from typing import Iterable, Iterator, Hashable
 
 
 class State(ABC):
     """This abstract class represents possible state the system can be in."""
 
+    # There are lots of states in the search; no dict per instance needed
+    __slots__ = ("_parent", "_applied_operator", "_diff_evaluator", "_depth",
+                 "_goal_difference", "_signature", "_operators_sequence",
+                 "_parents_sequence", "_applicable_cache")
+
     def __init__(self, diff_evaluator: "DifferenceEvaluator",
                  parent: "State" = None, applied_operator: "Operator" = None):
         """General initor of the state. Usually are states created in two main
@@ -44,6 +50,27 @@ class State(ABC):
         self._applied_operator = applied_operator
         self._diff_evaluator = diff_evaluator
 
+        # Number of ancestors; cached to avoid walking the parent chain
+        self._depth = 0 if parent is None else parent._depth + 1
+
+        """Memoized difference from a goal state in a form of a tuple
+        `(goal_state, evaluator, difference)`. It is filled by the
+        goal-oriented state space, so the difference is evaluated only once
+        per state."""
+        self._goal_difference: tuple = None
+
+        # Lazily built and then cached signature of the state
+        self._signature: Hashable = None
+
+        # Lazily built and then cached sequences of operators and ancestors
+        self._operators_sequence: tuple = None
+        self._parents_sequence: tuple = None
+
+        """The last filtered tuple of operators together with its applicable
+        operators; the state space always passes the same tuple of operators,
+        so each state filters them only once."""
+        self._applicable_cache: tuple = None
+
     @property
     def parent_state(self) -> "State":
         """State, on which was applied an operator and produced this state."""
@@ -51,8 +78,23 @@ class State(ABC):
 
     @parent_state.setter
     def parent_state(self, parent: "State"):
-        """Sets the parent, which this instance is was created from."""
+        """Sets the parent, which this instance is was created from.
+
+        The depth and the cached sequences are reset on this state only, so
+        the parent may be reassigned only on a leaf (a state with no children
+        created yet), like the shuffle does on its final state; descendants
+        of the state would keep their stale depths and sequences."""
         self._parent = parent
+        self._depth = 0 if parent is None else parent._depth + 1
+        self._operators_sequence = None
+        self._parents_sequence = None
+
+    @property
+    def depth(self) -> int:
+        """Number of operators applied from the initial state to get to this
+        one. It is equal to `len(self.operators_sequence)`, but it is cached
+        when the parent is set, so it costs no walk over the ancestors."""
+        return self._depth
 
     @property
     def applied_operator(self) -> "Operator":
@@ -61,8 +103,10 @@ class State(ABC):
 
     @applied_operator.setter
     def applied_operator(self, operator: "Operator"):
-        """Sets the given operator as the one applied on parent state."""
+        """Sets the given operator as the one applied on parent state. Like
+        the parent, it may be reassigned only on a leaf."""
         self._applied_operator = operator
+        self._operators_sequence = None
 
     @property
     def difference_evaluator(self) -> "DifferenceEvaluator":
@@ -76,26 +120,95 @@ class State(ABC):
         between two states."""
         self._diff_evaluator = diff_evaluator
 
+    def signature(self) -> "Hashable":
+        """Returns a hashable value identifying the state. Two states have to
+        have equal signatures if and only if the difference evaluator
+        considers them the same (their difference is equal to zero).
+
+        Signatures let the algorithms test the membership of states in their
+        collections by hashing instead of comparing the given state with
+        every stored one. The signature is built by `_create_signature` only
+        once per state; it's cached then, so the states must not change once
+        their signature was requested.
+
+        Returns
+        -------
+        Hashable
+            Signature of the state or None, when the state does not provide
+            any; then the equality has to be resolved by the difference
+            evaluator.
+        """
+        signature = self._signature
+        if signature is None:
+            signature = self._signature = self._create_signature()
+        return signature
+
+    def _create_signature(self) -> "Hashable":
+        """Builds the signature of the state (see `signature`). Descendants
+        are encouraged to override this method; None by default, which means
+        the state does not provide any signature.
+
+        Strings (or bytes) make the best signatures: unlike tuples, they keep
+        their hash once it's calculated, and interned strings (`sys.intern`)
+        are shared by all the equal states, so they compare by identity."""
+        return None
+
+    def applicability_key(self) -> "Hashable":
+        """Returns a hashable value determining which operators can be applied
+        on the state. Two states with equal keys have to have the same
+        operators applicable, so the state space can filter the operators only
+        once per key (see `StateSpace.applicable_operators`).
+
+        Usually it's only a small part of the state, like the position of
+        the empty field in a sliding puzzle.
+
+        Returns
+        -------
+        Hashable
+            Key of the applicability of the operators or None, when the state
+            does not provide any; then the operators are filtered for every
+            state separately. None by default.
+        """
+        return None
+
     @property
     def operators_sequence(self) -> "tuple[Operator]":
         """Returns all the applied operators from the initial state to this
-        one. These operators are formed in a tuple."""
+        one. These operators are formed in a tuple.
+
+        The tuple is cached, so it's built only once per state; the walk over
+        the ancestors stops at the first one with its sequence cached."""
+        if self._operators_sequence is not None:
+            return self._operators_sequence
 
         # Set current state as the default one
         current_state = self
-        operators = []
+        operators = deque()
 
         # While the current state has a parent (ie is not initial state)
-        while current_state.parent_state:
+        while current_state._parent is not None:
 
-            # Save the applied operator which result was current state creation
-            operators.append(current_state.applied_operator)
+            # Prepend the applied operator which created the current state
+            operators.appendleft(current_state._applied_operator)
 
             # Set current state as the parent
-            current_state = current_state.parent_state
+            current_state = current_state._parent
+
+            # The rest of the sequence is known already
+            if current_state._operators_sequence is not None:
+                break
 
-        # Return the reversed list of operators in tuple
-        return tuple(reversed(operators))
+        # Prepend the known rest to the operators (root to leaf already)
+        self._operators_sequence = (
+            (current_state._operators_sequence or ()) + tuple(operators))
+        return self._operators_sequence
+
+    @property
+    def operators_sequence_leaf_to_root(self) -> "tuple[Operator]":
+        """Returns all the applied operators from this state up to the initial
+        one; it's the `operators_sequence` in reversed order, but it's built
+        by the direct walk over the ancestors without any reversing."""
+        return tuple(self.iter_operators_up())
 
     @property
     def parents_sequence(self) -> "tuple[State]":
@@ -103,23 +216,82 @@ class State(ABC):
         initial to this state instance.
 
         This state is returned in the tuple too; at the last position (with
-        index of [-1]).
+        index of [-1]). The tuple is cached the same way as the
+        `operators_sequence` is.
         """
+        if self._parents_sequence is not None:
+            return self._parents_sequence
+
         # Current state set as a first one
         current_state = self
-        ancestors = [self]
+        ancestors = deque((self,))
 
         # While the current state has a parent
-        while current_state.parent_state:
+        while current_state._parent is not None:
 
             # Set it's parent as a new current state
-            current_state = current_state.parent_state
+            current_state = current_state._parent
+
+            # The rest of the sequence is known already
+            if current_state._parents_sequence is not None:
+                break
+
+            # Prepend current state to the ancestors
+            ancestors.appendleft(current_state)
+
+        # Prepend the known rest to the ancestors (root to leaf already)
+        self._parents_sequence = (
+            (current_state._parents_sequence or ()) + tuple(ancestors))
+        return self._parents_sequence
 
-            # Add current state to the list of ancestors
-            ancestors.append(current_state)
+    def solution_replay(self, initial_state: "State" = None
+                        ) -> "Iterator[State]":
+        """Replays the path to this state; it applies the operators of the
+        `operators_sequence` one by one on the given initial state and
+        generates the produced states in order of the application.
 
-        # Return the reversed list of ancestors as a tuple
-        return tuple(reversed(ancestors))
+        Parameters
+        ----------
+        initial_state : State, optional
+            State the operators are applied on; the initial state of the
+            path to this state (the root ancestor) by default.
+
+        Returns
+        -------
+        Iterator of State
+            States produced by the application of the operators, in order;
+            the last one is equivalent to this state.
+
+        Raises
+        ------
+        OperatorApplicationError
+            When any of the operators cannot be applied on the replayed state.
+        """
+        if initial_state is None:
+            initial_state = self.parents_sequence[0]
+
+        current_state = initial_state
+        for operator in self.operators_sequence:
+            current_state = current_state.apply(operator)
+            yield current_state
+
+    def iter_operators_up(self) -> "Iterator[Operator]":
+        """Generates the applied operators from the one which produced this
+        state up to the one applied on the initial state (in the reversed
+        order of the `operators_sequence`). Nothing is allocated, so it's
+        good for the callers not needing the whole sequence."""
+        current_state = self
+        while current_state._parent is not None:
+            yield current_state._applied_operator
+            current_state = current_state._parent
+
+    def iter_ancestors_up(self) -> "Iterator[State]":
+        """Generates this state and then all its ancestors up to the initial
+        state (in the reversed order of the `parents_sequence`)."""
+        current_state = self
+        while current_state is not None:
+            yield current_state
+            current_state = current_state._parent
 
     def filter_applicable(
             self, operators: "Iterable[Operator]") -> "tuple[Operator]":
@@ -138,7 +310,18 @@ class State(ABC):
         tuple of Operator
             Tuple of all operators which can be applied to this current state.
         """
-        return tuple(filter(lambda o: self.can_be_applied(o), operators))
+        # The same (immutable) tuple of operators was filtered already
+        cache = self._applicable_cache
+        if cache is not None and cache[0] is operators:
+            return cache[1]
+
+        # List comprehension (no generator frame) turned in to a tuple
+        applicable = tuple([
+            operator for operator in operators
+            if operator.can_be_applied_on(self)])
+        if isinstance(operators, tuple):
+            self._applicable_cache = (operators, applicable)
+        return applicable
 
     def can_be_applied(self, operator: "Operator") -> bool:
         """Method returning boolean information about availability of the
@@ -182,16 +365,42 @@ class State(ABC):
             When the given operator to be applied is considerate as not
             available step.
         """
-        if self.can_be_applied(operator):
-            return operator.apply_on(self)
+        child = self.try_apply(operator)
+        if child is not None:
+            return child
 
         # When the operator cannot be applied, raise error
-        raise OperatorApplicationError(
-            operator, self, f"Cannot apply operator {operator} on {self}")
+        raise OperatorApplicationError(operator, self)
+
+    def try_apply(self, operator: "Operator") -> "State":
+        """Tries to apply the given operator on this state like `apply` does,
+        but it returns None instead of raising an error, when the operator
+        cannot be applied.
 
-    def apply_all(self, operators: "Iterable[Operator]") -> "tuple[State]":
+        Parameters
+        ----------
+        operator : Operator
+            Operator to be applied on this state.
+
+        Returns
+        -------
+        State
+            The state created by the application of the given operator or
+            None, when it cannot be applied on this state.
+        """
+        if self.can_be_applied(operator):
+            return self._apply_unchecked(operator)
+        return None
+
+    def _apply_unchecked(self, operator: "Operator") -> "State":
+        """Applies the given operator on this state without checking its
+        applicability; it's meant for the operators known to be applicable
+        (like the filtered ones)."""
+        return operator._apply_unchecked_on(self)
+
+    def apply_all(self, operators: "Iterable[Operator]") -> "list[State]":
         """Method tries to apply all the given operators on this state. It
-        results in a tuple of states.
+        results in a list of states.
 
         Only applicable operators are applied. Others are omitted.
 
@@ -204,12 +413,14 @@ class State(ABC):
 
         Returns
         -------
-        tuple of State
-            Tuple of states created while applying the given operator on this
+        list of State
+            List of states created while applying the given operator on this
             state.
         """
-        return tuple(map(
-            lambda o: self.apply(o), self.filter_applicable(operators)))
+        # The filtered operators are known to be applicable
+        apply = self._apply_unchecked
+        return [apply(operator)
+                for operator in self.filter_applicable(operators)]
 
 
 class Operator(ABC):
@@ -219,6 +430,8 @@ class Operator(ABC):
     another state.
     """
 
+    __slots__ = ("_name",)
+
     def __init__(self, operator_name: str):
         """Initor of the Operator taking the operator name only. This is name
         is used to distinguish various operators and understand the solution.
@@ -271,6 +484,14 @@ class Operator(ABC):
             child of the given state.
         """
 
+    def _apply_unchecked_on(self, state: "State") -> "State":
+        """Applies this operator on the given state already known to be
+        applicable (filtered by `can_be_applied_on`); it's used on the
+        expansion paths of the framework only. It's the same as `apply_on` by
+        default; operators checking the applicability again in `apply_on`
+        may override it to skip the second check."""
+        return self.apply_on(state)
+
     def __repr__(self):
         """Instance representation by human-readable operator name."""
         return self.operator_name
@@ -300,10 +521,34 @@ class DifferenceEvaluator(ABC):
         4) `∀ s1, s2, s3 ∈ S, d(s1, s2) + d(s2, s3) >= d(s1, s3)`
     """
 
+    __slots__ = ()
+
+    @property
+    def integer_differences(self) -> bool:
+        """Returns if all the differences evaluated by this evaluator are
+        integers (like counts of misplaced items or steps). The algorithms may
+        use it to pick faster data structures, like the bucket queue for the
+        fringe ordered by the differences. False by default."""
+        return False
+
+    @property
+    def tolerance(self) -> float:
+        """The greatest difference still considered as zero (0). Evaluators
+        calculating the differences in floating-point arithmetic (like by a
+        square root) may override it, so the rounding errors don't make the
+        equal states different. Zero (0) by default."""
+        return 0
+
+    def is_zero(self, difference: float) -> bool:
+        """Returns if the given difference evaluated by this evaluator means
+        the two states are the same (it's within the tolerance)."""
+        return difference <= self.tolerance
+
     def are_the_same(self, state1: "State", state2: "State") -> bool:
         """Method able to evaluate if the two given states are the same. The
         equality of the states is True if and only if the calculated difference
-        between the two states is zero (0). Otherwise it returns False.
+        between the two states is zero (0), within the `tolerance`. Otherwise
+        it returns False.
 
         Parameters
         ----------
@@ -321,7 +566,35 @@ class DifferenceEvaluator(ABC):
             Boolean information about the equivalence of the two states. If
             their mutual distance (difference) is zero, it returns True (3).
         """
-        return self.evaluate_difference(state1, state2) == 0
+        # States providing signatures are equal iff their signatures are
+        signature1 = state1.signature()
+        if signature1 is not None:
+            signature2 = state2.signature()
+            if signature2 is not None:
+                return signature1 == signature2
+        return self.equals(state1, state2)
+
+    def equals(self, state1: "State", state2: "State") -> bool:
+        """Decides the equality of the two given states without their
+        signatures. It's the same as if their difference is zero (0), which
+        is how it's decided by default; evaluators able to find a difference
+        faster than evaluating the whole of it (like stopping at the first
+        different item) should override this.
+
+        Parameters
+        ----------
+        state1 : State
+            First state to be compared with the second one
+
+        state2 : State
+            Second state to be compared with the first one
+
+        Returns
+        -------
+        bool
+            If the difference between the two states is zero (0).
+        """
+        return self.is_zero(self.evaluate_difference(state1, state2))
 
     @abstractmethod
     def evaluate_difference(self, state1: "State", state2: "State") -> float:
@@ -350,6 +623,39 @@ class DifferenceEvaluator(ABC):
             The result should never be negative (1).
         """
 
+    def difference_after_move(self, difference: float, goal: "State",
+                              value: "Hashable", from_index: int,
+                              to_index: int) -> "float | None":
+        """Hook for the evaluators able to update a known difference from the
+        goal incrementally; a state moving a value between two positions can
+        pass the difference of its own to the produced state instead of
+        evaluating the produced state from scratch.
+
+        Parameters
+        ----------
+        difference : float
+            Known difference of the original state from the goal
+
+        goal : State
+            Goal state the difference has been evaluated against
+
+        value : Hashable
+            Value moved by the applied operator
+
+        from_index : int
+            Position the value has been moved from
+
+        to_index : int
+            Position the value has been moved to
+
+        Returns
+        -------
+        float or None
+            Difference of the produced state from the goal, or None when the
+            evaluator cannot update it incrementally (by default).
+        """
+        return None
+
 
 class OperatorApplicationError(Exception):
     """Instances of this class represents the error while trying to apply
@@ -360,7 +666,9 @@ class OperatorApplicationError(Exception):
     # Private general message about not-availability of the application
     __MSG = "Operator cannot be applied"
 
-    def __init__(self, operator: Operator, state: State, message: str = __MSG):
+    __slots__ = ("_operator", "_state", "_message")
+
+    def __init__(self, operator: Operator, state: State, message: str = None):
         """Initor preparing the error instance to be risen.
 
         Parameters
@@ -372,12 +680,22 @@ class OperatorApplicationError(Exception):
             State on which cannot the operator be applied
 
         message : str, optional
-            Message to be passed as an description of the error.
+            Message to be passed as an description of the error. When it's
+            not given, the message naming the operator and the state is
+            formatted only when it's actually needed (see `__str__`).
         """
-        Exception.__init__(self, message)
+        Exception.__init__(self, operator, state)
 
         self._operator = operator
         self._state = state
+        self._message = message
+
+    def __str__(self):
+        """The given message or the message naming the operator and the
+        state, which is formatted only now."""
+        if self._message is not None:
+            return self._message
+        return f"{self.__MSG}: {self._operator} on {self._state}"
 
     @property
     def operator(self) -> Operator:
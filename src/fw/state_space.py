@@ -1,9 +1,9 @@
 """This module contains the actual state space abstraction definition."""
 
 
-from typing import Iterable
+from typing import Callable, Iterable, Hashable
 from abc import ABC
-from random import choice
+from random import Random, random, randbytes
 
 from .state import State, Operator, DifferenceEvaluator
 
@@ -13,6 +13,10 @@ class StateSpace(ABC):
     state spaces. It provides only the most basic functionality to define
     the problem."""
 
+    __slots__ = ("_initial_state", "_operators", "_diff_evaluator",
+                 "_applicable_by_key", "_checks_and_appliers",
+                 "_appliers_by_key", "_evaluate_difference")
+
     def __init__(self, initial_state: State, operators: Iterable[Operator],
                  diff_evaluator: DifferenceEvaluator):
         """Initor of the abstract class.
@@ -36,6 +40,22 @@ class StateSpace(ABC):
         self._operators = tuple(operators)
         self._diff_evaluator = diff_evaluator
 
+        # Bound evaluation method of the evaluator (looked up only once)
+        self._evaluate_difference = diff_evaluator.evaluate_difference
+
+        """Applicable operators by the applicability keys of the states. The
+        operators are fixed, so they are filtered only once for each key."""
+        self._applicable_by_key: dict[Hashable, tuple[Operator]] = {}
+
+        """Bound applicability checks and applications of the operators (and
+        the applications of the applicable ones by the applicability keys);
+        the expansion calls them without looking the methods up again. The
+        operators are applied only after the check, so unchecked."""
+        self._checks_and_appliers: tuple[tuple[Callable, Callable]] = tuple(
+            (operator.can_be_applied_on, operator._apply_unchecked_on)
+            for operator in self._operators)
+        self._appliers_by_key: dict[Hashable, tuple[Callable]] = {}
+
     @property
     def initial_state(self) -> State:
         """State the solution search starts in."""
@@ -59,6 +79,64 @@ class StateSpace(ABC):
         """Setter for the evaluator used for calculation of the difference
         between two states."""
         self._diff_evaluator = diff_evaluator
+        self._evaluate_difference = diff_evaluator.evaluate_difference
+
+    def applicable_operators(self, state: State) -> tuple[Operator]:
+        """Returns the operators of the state space applicable on the given
+        state.
+
+        When the state provides its applicability key, the operators are
+        filtered only for the first state with the key; all the others get
+        the same tuple by a single lookup.
+
+        Parameters
+        ----------
+        state : State
+            State the operators should be applicable on
+
+        Returns
+        -------
+        tuple of Operator
+            Operators of the state space, that can be applied on the state.
+        """
+        key = state.applicability_key()
+        if key is None:
+            return state.filter_applicable(self._operators)
+
+        applicable = self._applicable_by_key.get(key)
+        if applicable is None:
+            applicable = state.filter_applicable(self._operators)
+            self._applicable_by_key[key] = applicable
+        return applicable
+
+    def expand(self, state: State) -> list[State]:
+        """Returns all the children of the given state; the states produced
+        by the application of each of the applicable operators (see
+        `applicable_operators`). The operators are known to be applicable,
+        so they are applied without checking it again.
+
+        Parameters
+        ----------
+        state : State
+            State to be expanded
+
+        Returns
+        -------
+        list of State
+            Children of the given state.
+        """
+        key = state.applicability_key()
+        if key is None:
+            return [apply_on(state)
+                    for can_be_applied_on, apply_on
+                    in self._checks_and_appliers if can_be_applied_on(state)]
+
+        appliers = self._appliers_by_key.get(key)
+        if appliers is None:
+            appliers = tuple([operator._apply_unchecked_on for operator
+                              in self.applicable_operators(state)])
+            self._appliers_by_key[key] = appliers
+        return [apply_on(state) for apply_on in appliers]
 
     def difference(self, state1: State, state2: State) -> float:
         """Method defining the signature of the states difference evaluation.
@@ -67,7 +145,7 @@ class StateSpace(ABC):
         states in decimal (float) value. This evaluation is done using a given
         difference evaluator.
         """
-        return self.difference_evaluator.evaluate_difference(state1, state2)
+        return self._evaluate_difference(state1, state2)
 
     def difference_from_initial(self, state: State) -> float:
         """Returns the evaluation between the initial state and the given
@@ -80,6 +158,8 @@ class GoalOrientedStateSpace(StateSpace):
     the willed result is a specific sequence of operators leading to the
     state or it's equivalent."""
 
+    __slots__ = ("_goal_state",)
+
     def __init__(self, initial_state: State, operators: Iterable[Operator],
                  diff_evaluator: DifferenceEvaluator, goal_state: State):
         """Initor of the abstract class.
@@ -120,8 +200,90 @@ class GoalOrientedStateSpace(StateSpace):
             self.initial_state, self.goal_state)
 
     def difference_from_goal(self, state: State) -> float:
-        """"""
-        return self.difference(state, self.goal_state)
+        """Returns the evaluation between the given state and the goal state.
+
+        The result is memoized on the given state (together with the goal and
+        the evaluator it was evaluated by), so the repeated calls for the same
+        state, like the goal test and the ordering of the fringe, evaluate the
+        difference only once."""
+        goal_state = self._goal_state
+        evaluator = self._diff_evaluator
+        memo = state._goal_difference
+        if (memo is not None and memo[0] is goal_state
+                and memo[1] is evaluator):
+            return memo[2]
+
+        difference = self._evaluate_difference(state, goal_state)
+        state._goal_difference = (goal_state, evaluator, difference)
+        return difference
+
+    def is_goal(self, state: State) -> bool:
+        """Returns if the given state is equivalent to the goal state.
+
+        When both the states provide their signatures, they are just compared,
+        which is much cheaper than the evaluation of the difference. Otherwise
+        the difference between the states has to be equal to zero (0), within
+        the tolerance of the evaluator."""
+        signature = state.signature()
+        if signature is not None:
+            goal_signature = self._goal_state.signature()
+            if goal_signature is not None:
+                return signature == goal_signature
+        return self._diff_evaluator.is_zero(
+            self.difference_from_goal(state))
+
+    def find_goal(self, states: Iterable[State]) -> State:
+        """Returns the first of the given states equivalent to the goal state
+        or None, if there is no such state.
+
+        It's the goal test of the whole batch of states (like the children
+        of an expanded state) at once; the goal signature is resolved only
+        once for all of them."""
+        goal_signature = self._goal_state.signature()
+        is_zero = self._diff_evaluator.is_zero
+        for state in states:
+            signature = state.signature()
+            if signature is not None and goal_signature is not None:
+                if signature == goal_signature:
+                    return state
+            elif is_zero(self.difference_from_goal(state)):
+                return state
+        return None
+
+
+def _random_applicable(state: State, operators: Iterable[Operator],
+                       rand: Callable[[], float]) -> Operator:
+    """Picks one of the given operators applicable on the given state at
+    random (uniformly) by the reservoir sampling; the operators are walked
+    only once and the applicable ones are not collected anywhere.
+
+    Parameters
+    ----------
+    state : State
+        State the picked operator has to be applicable on.
+
+    operators : Iterable of Operator
+        Operators to pick from.
+
+    rand : Callable
+        Function returning a random float from the interval [0, 1).
+
+    Returns
+    -------
+    Operator
+        Randomly picked applicable operator or None, when none of the
+        operators is applicable.
+    """
+    picked = None
+    applicable = 0
+    for operator in operators:
+        if operator.can_be_applied_on(state):
+            applicable += 1
+
+            # The n-th applicable one replaces the picked one with prob. 1/n
+            if rand() * applicable < 1:
+                picked = operator
+    return picked
 
 
 class StateSpaceShuffle:
@@ -137,8 +299,13 @@ class StateSpaceShuffle:
     Instances of this class are meant to be used mostly for testing purposes.
     """
 
+    __slots__ = ("_goal_state", "_operators", "_diff_evaluator",
+                 "_shuffle_grade", "_applied_operators", "_random",
+                 "_randbytes")
+
     def __init__(self, goal_state: State, operators: Iterable[Operator],
-                 diff_evaluator: DifferenceEvaluator, shuffle_grade: int):
+                 diff_evaluator: DifferenceEvaluator, shuffle_grade: int,
+                 rng: Random = None):
         """Initor of the class.
 
         Parameters
@@ -159,6 +326,11 @@ class StateSpaceShuffle:
         shuffle_grade : int
             The number of iterations of picking and applying the operator on
             the state. This defines the grade of randomization.
+
+        rng : Random, optional
+            Generator of random numbers picking the operators; it can be
+            given seeded for replays. The shared generator of the `random`
+            module is used by default.
         """
 
         self._goal_state = goal_state
@@ -170,6 +342,12 @@ class StateSpaceShuffle:
         filled after first performed shuffle."""
         self._applied_operators: list[Operator] = []
 
+        # Bound function returning random floats from [0, 1)
+        self._random = rng.random if rng is not None else random
+
+        # Bound function returning the given number of random bytes
+        self._randbytes = rng.randbytes if rng is not None else randbytes
+
         # Shuffle grade check
         if self._shuffle_grade < 0:
             raise Exception(
@@ -215,19 +393,49 @@ class StateSpaceShuffle:
         # The current state space the randomization starts from is the goal
         current_state = self.goal_state
 
-        # Randomize the goal state in number of iterations
-        for _ in range(self.shuffle_grade):
+        # Shorthands for the loop
+        operators = self._operators
+        rand = self._random
+        applied_operators = self._applied_operators
 
-            # Selection of the applicable operators only
-            applicable_ops = current_state.filter_applicable(self.operators)
+        """Applicable operators by the applicability keys of the states (see
+        `State.applicability_key`); a step from a state with an already known
+        key is a single lookup and a random index into the tuple."""
+        applicable_by_key: dict[Hashable, tuple[Operator]] = {}
+
+        """Random 32-bit words for all the iterations drawn at once; each of
+        them is scaled to an index into the applicable operators. They are
+        decoded as little-endian, so the shuffles are the same on any
+        platform for the same seed."""
+        data = self._randbytes(4 * self.shuffle_grade)
+
+        # Randomize the goal state in number of iterations
+        for offset in range(0, len(data), 4):
+            word = int.from_bytes(data[offset:offset + 4], "little")
 
             """Random pick of any of the applicable operators. This operator
             is stored at the instance level as the one of the applied ops.
             This operator is then applied on the current state, producing the
             new current state, that is altered again in the next iteration."""
-            random_operator = choice(applicable_ops)
-            self._applied_operators.append(random_operator)
-            current_state = current_state.apply(random_operator)
+            key = current_state.applicability_key()
+            if key is None:
+                random_operator = _random_applicable(
+                    current_state, operators, rand)
+            else:
+                applicable = applicable_by_key.get(key)
+                if applicable is None:
+                    applicable = current_state.filter_applicable(operators)
+                    applicable_by_key[key] = applicable
+                random_operator = (
+                    applicable[(word * len(applicable)) >> 32]
+                    if applicable else None)
+
+            if random_operator is None:
+                raise Exception(f"No operator applicable on {current_state}")
+            applied_operators.append(random_operator)
+
+            # The operator is known to be applicable; applied directly
+            current_state = random_operator.apply_on(current_state)
 
         # Clear the future initial state from previous paths
         current_state.parent_state = None
@@ -1,22 +1,30 @@
 """"""
 
 
+from functools import lru_cache
+from sys import intern
 from typing import Iterable
 from src.fw import (State, Operator, GoalOrientedStateSpace,
                     DifferenceEvaluator, StateSpaceShuffle,
                     FringeBasedAlgorithm)
 
 
+class GridError(Exception):
+    """Error of the sliding puzzle grid or its moves."""
+
+
 class Field:
     """"""
 
+    __slots__ = ("_x", "_y", "_value")
+
     def __init__(self, value: str, x: int, y: int):
         """"""
 
         if x < 0:
-            raise Exception(f"x cannot be < 0: {x}")
+            raise GridError(f"x cannot be < 0: {x}")
         elif y < 0:
-            raise Exception(f"y cannot be < 0: {y}")
+            raise GridError(f"y cannot be < 0: {y}")
 
         self._x = x
         self._y = y
@@ -52,56 +60,211 @@ class Field:
 class Grid(State):
     """"""
 
+    __slots__ = ("_board", "_empty_index", "_key", "_positions", "_distances",
+                 "__width", "__height")
+
     _EMPTY = "_"
 
     def __init__(self, fields: Iterable[Field],
                  diff_evaluator: DifferenceEvaluator, parent: State = None,
                  operator: Operator = None, width: int = 3, height: int = 3):
         """"""
+        board = [None] * (width * height)
+        for field in fields:
+            if not (0 <= field.x < width and 0 <= field.y < height):
+                raise GridError(
+                    f"Field {field} is out of the grid {width}x{height}")
+            index = field.y * width + field.x
+            if board[index] is not None:
+                raise GridError(f"Field {field} overlaps '{board[index]}'")
+            board[index] = field.value
+
+        if None in board:
+            raise GridError(f"Fields do not cover the grid {width}x{height}")
+
+        board = tuple(board)
+        self._check_board(board, width, height)
+        self._init_board(board, diff_evaluator, parent, operator,
+                         width, height)
+
+    def _init_board(self, board: tuple[str],
+                    diff_evaluator: DifferenceEvaluator, parent: State,
+                    operator: Operator, width: int, height: int,
+                    key: int = None):
+        """Values of the fields are held in a flat tuple row by row; the
+        fields are not stored as objects at all."""
         State.__init__(self, diff_evaluator, parent, operator)
 
-        self._fields = list(fields)
+        self._board = board
+        self._empty_index = board.index(self._EMPTY)
+
+        # Board packed into an int (see `_pack_board`); None if not numbered
+        if key is None:
+            key = _pack_board(board, self._EMPTY)
+        self._key = key
+
+        # Lazily built coords of the fields by their values
+        self._positions: dict[str, tuple[int, int]] = None
+
+        # Lazily built Manhattan distances of the fields by their values
+        self._distances: dict[str, tuple[int]] = None
         self.__width = width
         self.__height = height
 
+    @classmethod
+    def from_board(cls, board: tuple[str], diff_evaluator: DifferenceEvaluator,
+                   parent: State = None, operator: Operator = None,
+                   width: int = 3, height: int = 3) -> "Grid":
+        """Creates the grid of the given values of the fields row by row."""
+        board = tuple(board)
+        cls._check_board(board, width, height)
+        grid = cls.__new__(cls)
+        grid._init_board(
+            board, diff_evaluator, parent, operator, width, height)
+        return grid
+
+    @classmethod
+    def _check_board(cls, board: tuple[str], width: int, height: int):
+        """Checks the board fills the grid by distinct values including the
+        empty one. The moves keep the board complete, so only the grids not
+        created by a move are checked."""
+        if len(board) != width * height:
+            raise GridError(
+                f"Board of {len(board)} fields for the grid {width}x{height}")
+        if len(set(board)) != len(board):
+            raise GridError(f"Values of the fields are not unique: {board}")
+        if cls._EMPTY not in board:
+            raise GridError(f"No empty field '{cls._EMPTY}' in {board}")
+
+    @property
+    def board(self) -> tuple[str]:
+        """Values of the fields row by row."""
+        return self._board
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
     @property
     def fields(self) -> tuple[Field]:
-        return tuple(self._fields)
+        """Fields of the grid; created on every access from the board, so
+        changing them does not change the grid."""
+        width = self.__width
+        return tuple(Field(value, index % width, index // width)
+                     for index, value in enumerate(self._board))
+
+    @property
+    def positions(self) -> dict[str, tuple[int, int]]:
+        """Coords of the fields by their values. Built only once per grid,
+        so the goal grid (compared over and over) builds it only once."""
+        if self._positions is None:
+            width = self.__width
+            self._positions = {
+                value: (index % width, index // width)
+                for index, value in enumerate(self._board)}
+        return self._positions
+
+    @property
+    def distances(self) -> dict[str, tuple[int]]:
+        """Manhattan distances of the fields (by their values) of this grid
+        from each of the indexes of the board. Built only once per grid, so
+        comparing a grid with the goal is a lookup per field."""
+        if self._distances is None:
+            width = self.__width
+            self._distances = {
+                value: tuple(abs(x - index % width) + abs(y - index // width)
+                             for index in range(len(self._board)))
+                for value, (x, y) in self.positions.items()}
+        return self._distances
+
+    @property
+    def empty_coords(self) -> tuple[int, int]:
+        return self._coords_of(self._empty_index)
 
     @property
     def empty_field(self) -> Field:
-        return self.field_by_value(self._EMPTY)
+        return Field(self._EMPTY, *self.empty_coords)
 
     @property
     def border_values(self) -> tuple[int, int, int, int]:
         return 0, self.__width, 0, self.__height
 
+    def _coords_of(self, index: int) -> tuple[int, int]:
+        return index % self.__width, index // self.__width
+
     def field_by_value(self, value: str) -> Field:
-        for field in self.fields:
-            if field.value == value:
-                return field
-        raise Exception(f"No field with value {value}")
+        coords = self.positions.get(value)
+        if coords is not None:
+            return Field(value, *coords)
+        raise GridError(f"No field with value {value}")
 
     def field_by_coords(self, x: int, y: int) -> Field:
-        for field in self.fields:
-            if field.x == x and field.y == y:
-                return field
-        raise Exception(f"No field with coords [{x}, {y}]")
+        if self.has_coords(x, y):
+            return Field(self._board[y * self.__width + x], x, y)
+        raise GridError(f"No field with coords [{x}, {y}]")
+
+    def _create_signature(self) -> str:
+        """Values of all the fields row by row, separated by commas. The
+        string is interned, so the equal grids share it and its hash is
+        calculated only once.
+
+        The boards of numbered fields are packed into a single int instead
+        (see `_pack_board`)."""
+        if self._key is not None:
+            return self._key
+        return intern(",".join(self._board))
+
+    def applicability_key(self) -> int:
+        """The moves applicable depend only on the position of the empty
+        field."""
+        return self._empty_index
 
     def has_coords(self, x: int, y: int) -> bool:
-        for field in self.fields:
-            if field.x == x and field.y == y:
-                return True
-        return False
+        return 0 <= x < self.__width and 0 <= y < self.__height
+
+    def move_empty_to(self, x: int, y: int, operator: Operator) -> "Grid":
+        """Returns the child grid with the empty field swapped with the field
+        at the given coords."""
+        board = list(self._board)
+        empty_index = self._empty_index
+        other_index = y * self.__width + x
+        value = board[empty_index] = board[other_index]
+        board[other_index] = self._EMPTY
+
+        """The packed key is updated only by the moved field; the empty one
+        is packed as zero, so it makes no difference."""
+        key = self._key
+        if key is not None:
+            bits = (len(board) - 1).bit_length()
+            code = int(value)
+            key ^= code << (bits * other_index)
+            key ^= code << (bits * empty_index)
+
+        cls = type(self)
+        grid = cls.__new__(cls)
+        grid._init_board(tuple(board), self._diff_evaluator, self, operator,
+                         self.__width, self.__height, key)
+
+        """The difference from the goal memoized on this grid is passed to
+        the child updated only by the two moved fields (when the evaluator
+        can do it), so the child is not evaluated from scratch."""
+        memo = self._goal_difference
+        if memo is not None:
+            goal_state, evaluator, difference = memo
+            difference = evaluator.difference_after_move(
+                difference, goal_state, value, other_index, empty_index)
+            if difference is not None:
+                grid._goal_difference = (goal_state, evaluator, difference)
+        return grid
 
     def clone(self) -> "Grid":
-        new_fields = []
-
-        for field in self.fields:
-            new_fields.append(field.clone())
-
-        return Grid(new_fields, self.difference_evaluator, self.parent_state,
-                    self.applied_operator, self.__width, self.__height)
+        return type(self).from_board(
+            self._board, self.difference_evaluator, self.parent_state,
+            self.applied_operator, self.__width, self.__height)
 
     @staticmethod
     def replace(field1: Field, field2: Field):
@@ -116,38 +279,78 @@ class Grid(State):
         field2.y = f1_c[1]
 
     def __repr__(self):
-        result = ""
-        for y in range(self.__height):
-            for x in range(self.__width):
-                result = f"{result}{self.field_by_coords(x, y).value:3} "
-            result = f"{result}\n"
-        return result
+        # Rows are sliced from the board directly; no fields are looked up
+        width = self.__width
+        return "".join(
+            "".join(f"{value:3} " for value in self._board[y:y + width]) + "\n"
+            for y in range(0, len(self._board), width))
+
+
+def _pack_board(board: tuple[str], empty: str) -> "int | None":
+    """Packs the board of the numbered fields into a single int; each field
+    takes the same number of bits (enough for the number of fields) and the
+    empty field (of the given value) is packed as zero. The equal boards are
+    packed into equal ints, which makes them cheap signatures.
+
+    Returns None, when any of the values is not a positive number fitting
+    the bits.
+    """
+    bits = (len(board) - 1).bit_length()
+    key = 0
+    for index, value in enumerate(board):
+        if value == empty:
+            continue
+        code = int(value) if value.isdecimal() else 0
+        if not code or code >> bits:
+            return None
+        key |= code << (bits * index)
+    return key
 
 
 class ManhattanEvaluator(DifferenceEvaluator):
     """"""
 
+    __slots__ = ()
+
+    @property
+    def integer_differences(self) -> bool:
+        """Sums of the distances are always integers."""
+        return True
+
     def evaluate_difference(self, g1: "Grid", g2: "Grid") -> float:
-        # Total Manhattan distance between the two grids
-        total_difference = 0
+        # Distances from the fields of the second grid (cached by the grid)
+        distances = g2.distances
+
+        # Sum of the distances of each field in the first grid
+        return sum([distances[value][index]
+                    for index, value in enumerate(g1.board)])
 
-        # For each field in the first grid
-        for f1 in g1.fields:
+    def difference_after_move(self, difference: float, goal: "Grid",
+                              value: str, from_index: int,
+                              to_index: int) -> float:
+        """Returns the difference from the goal after the field of the given
+        value was moved between the given indexes (swapped with the empty
+        one); only the distances of the two fields change."""
+        distances = goal.distances
 
-            # Shorthand for the field of same value in the second grid
-            f2 = g2.field_by_value(f1.value)
+        # The moved field gets from the from_index to the to_index
+        moved = distances[value]
+        difference += moved[to_index] - moved[from_index]
 
-            # Scallarize the vector of difference
-            total_difference += abs(f2.x - f1.x)
-            total_difference += abs(f2.y - f1.y)
+        # The empty field gets the other way
+        empty = distances[goal._EMPTY]
+        return difference + empty[from_index] - empty[to_index]
 
-        # Return result
-        return total_difference
+    def equals(self, g1: "Grid", g2: "Grid") -> bool:
+        # Same values on the same places
+        return g1.board == g2.board
 
 
 class MoveOperator(Operator):
     """"""
 
+    __slots__ = ("_schema",)
+
     def __init__(self, operator_name: str, schema: tuple[int, int]):
         Operator.__init__(self, operator_name)
         self._schema = schema
@@ -160,41 +363,27 @@ class MoveOperator(Operator):
         return x + self.schema[0], y + self.schema[1]
 
     def can_be_applied_on(self, state: "Grid") -> bool:
-        ffrom = state.empty_field
-        return state.has_coords(*self.coords_of_the_other(ffrom.x, ffrom.y))
+        return state.has_coords(*self.coords_of_the_other(*state.empty_coords))
 
     def apply_on(self, state: "Grid") -> "Grid":
-        if self.can_be_applied_on(state):
-            new_s = state.clone()
-            empty_f = new_s.empty_field
-            dest_field = self.coords_of_the_other(empty_f.x, empty_f.y)
-            new_s.replace(empty_f, new_s.field_by_coords(*dest_field))
-
-            new_s.parent_state = state
-            new_s.applied_operator = self
-
-            return new_s
+        x, y = self.coords_of_the_other(*state.empty_coords)
+        if state.has_coords(x, y):
+            return state.move_empty_to(x, y, self)
 
         else:
-            raise Exception(f"Cannot be applied: {self=} on {state=}")
-
+            raise GridError(f"Cannot be applied: {self=} on {state=}")
 
-def _directions() -> tuple[str, str, str, str]:
-    return "RIGHT", "UP", "LEFT", "DOWN"
 
+# Names of the moves of the empty field
+_DIRECTIONS = ("RIGHT", "UP", "LEFT", "DOWN")
 
-def _moving_schemas() -> dict:
-    return {
-        _directions()[0]: (1, 0),
-        _directions()[1]: (0, -1),
-        _directions()[2]: (-1, 0),
-        _directions()[3]: (0, 1)
-    }
+# Vectors of the moves of the empty field (in order of the directions)
+_MOVING_SCHEMAS = ((1, 0), (0, -1), (-1, 0), (0, 1))
 
 
+@lru_cache(maxsize=None)
 def operators() -> tuple[MoveOperator]:
-    return tuple(map(lambda item: MoveOperator(item[0], item[1]),
-                     _moving_schemas().items()))
+    return tuple(map(MoveOperator, _DIRECTIONS, _MOVING_SCHEMAS))
 
 def ordered_state(diff_eval: DifferenceEvaluator,
                   width: int = 3, height: int = 3):
@@ -233,35 +422,31 @@ from src.algorithms.random_operator_picker import RandomOperatorPicker
 from src.fw import SolutionSuccess
 
 
-shuffler = shuffle(25)
-state_space = shuffler.shuffle()
-goal_state: Grid = state_space.goal_state
-initial_state: Grid = state_space.initial_state
-print(shuffler.applied_operators)
-
-algos = [
-    GOAStar(state_space_gen(initial_state, goal_state)),
-    GOBFS(state_space_gen(initial_state, goal_state)),
-    GOIDDFS(state_space_gen(initial_state, goal_state), depth_increment=2),
-    GOBestFirstSearch(state_space_gen(initial_state, goal_state)),
-    GODFS(state_space_gen(initial_state, goal_state)),
-    RandomOperatorPicker(state_space_gen(initial_state, goal_state)),
-]
-
-start = None
-print(initial_state)
-print(goal_state)
-for algo in algos:
-    try:
-        algo()
-    except SolutionSuccess as success:
-        algo: FringeBasedAlgorithm = algo
-        print(
-            algo.algorithm_name, f"visited: {algo.number_of_seen}, time: "
-            f"{algo.ran_for}", f"Applied operators: "
-            f"{len(success.final_state.operators_sequence)}")
-
-
-
-
-
+if __name__ == "__main__":
+    shuffler = shuffle(25)
+    state_space = shuffler.shuffle()
+    goal_state: Grid = state_space.goal_state
+    initial_state: Grid = state_space.initial_state
+    print(shuffler.applied_operators)
+
+    algos = [
+        GOAStar(state_space_gen(initial_state, goal_state)),
+        GOBFS(state_space_gen(initial_state, goal_state)),
+        GOIDDFS(state_space_gen(initial_state, goal_state), depth_increment=2),
+        GOBestFirstSearch(state_space_gen(initial_state, goal_state)),
+        GODFS(state_space_gen(initial_state, goal_state)),
+        RandomOperatorPicker(state_space_gen(initial_state, goal_state)),
+    ]
+
+    start = None
+    print(initial_state)
+    print(goal_state)
+    for algo in algos:
+        try:
+            algo()
+        except SolutionSuccess as success:
+            algo: FringeBasedAlgorithm = algo
+            print(
+                algo.algorithm_name, f"visited: {algo.number_of_seen}, time: "
+                f"{algo.ran_for}", f"Applied operators: "
+                f"{success.final_state.depth}")
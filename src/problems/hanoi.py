@@ -1,4 +1,7 @@
 """"""
+from functools import lru_cache
+from sys import intern
+
 from src.algorithms.goal_oriented_a_star import GOAStar
 from src.algorithms.goal_oriented_best_first import GOBestFirstSearch
 from src.algorithms.goal_oriented_bfs import GOBFS
@@ -10,89 +13,86 @@ from src.fw.state_space import StateSpace, GoalOrientedStateSpace
 from src.algorithms.random_operator_picker import RandomOperatorPicker
 
 
-class Disk:
-    """"""
-
-    def __init__(self, disk_size: int):
-        """"""
-        self._size = disk_size
-
-        if self._size < 1:
-            raise Exception(f"Disk size has to be at least 1: {self._size}")
-
-    @property
-    def size(self) -> int:
-        """"""
-        return self._size
-
-    def clone(self) -> "Disk":
-        return Disk(self.size)
-
-    def __repr__(self):
-        return str(self.size)
+class HanoiError(Exception):
+    """Error of the Hanoi towers state or its moves."""
 
 
 class Stick:
     """"""
 
+    __slots__ = ("_stick_number", "_disks", "_mask")
+
     def __init__(self, stick_number: int):
         """"""
         self._stick_number = stick_number
-        self._disks: list[Disk] = []
+
+        # Disks are represented just by their sizes (from the bottom)
+        self._disks: list[int] = []
+
+        # Bit of each size of the disks on the stick is set
+        self._mask = 0
 
     @property
     def stick_number(self) -> int:
         return self._stick_number
 
     @property
-    def disks(self) -> tuple[Disk]:
+    def disks(self) -> tuple[int]:
+        """Sizes of the disks on the stick from the bottom."""
         return tuple(self._disks)
 
     @property
     def has_any(self) -> bool:
         """"""
-        return len(self) > 0
+        return bool(self._disks)
 
     def has_disk_of_size(self, size: int) -> bool:
         """"""
-        for disk in self.disks:
-            if disk.size == size:
-                return True
-        return False
+        return bool(self._mask >> size & 1)
 
     def size_of_top(self) -> int:
         """"""
-        if self.has_any:
-            return self.disks[-1].size
-        raise Exception("No disk")
-
-    def pop(self) -> Disk:
-        """Removes and returns the disk on top."""
-        return self._disks.pop()
-
-    def append(self, disk: Disk):
-        """"""
-        self._disks.append(disk)
+        if self._disks:
+            return self._disks[-1]
+        raise HanoiError("No disk")
+
+    def pop(self) -> int:
+        """Removes the disk on top and returns its size."""
+        if not self._disks:
+            raise HanoiError(f"No disk to take from {self}")
+        size = self._disks.pop()
+        self._mask ^= 1 << size
+        return size
+
+    def append(self, size: int):
+        """Puts the disk of the given size on top; only the disk on top is
+        compared, so the stick stays acceptable as long as it was."""
+        if size < 1:
+            raise HanoiError(f"Disk size has to be at least 1: {size}")
+        if self._disks and self._disks[-1] < size:
+            raise HanoiError(f"Disk {size} cannot be put on {self}")
+        self._disks.append(size)
+        self._mask |= 1 << size
 
     def clone(self) -> "Stick":
         """"""
-        stick = Stick(self.stick_number)
-        for disk in self.disks:
-            stick.append(disk.clone())
+        stick = Stick(self._stick_number)
+        stick._disks = self._disks.copy()
+        stick._mask = self._mask
         return stick
 
     def check(self) -> bool:
         """"""
         if len(self) > 1:
-            previous = self.disks[0]
-            for disk in self.disks[1:]:
-                if disk.size > previous.size:
+            previous = self._disks[0]
+            for size in self._disks[1:]:
+                if size > previous:
                     return False
         return True
 
     def __len__(self):
         """"""
-        return len(self.disks)
+        return len(self._disks)
 
     def __repr__(self):
         return f"[{self.stick_number}: {self.disks}]"
@@ -101,6 +101,9 @@ class Stick:
 class HanoiState(State):
     """"""
 
+    __slots__ = ("_sticks", "_num_of_sticks", "_max_disk_size",
+                 "_stick_indexes")
+
     def __init__(
             self, diff_evaluator: "DifferenceEvaluator",
             sticks: list[Stick], max_disk_size: int,
@@ -113,9 +116,21 @@ class HanoiState(State):
         self._num_of_sticks = len(sticks)
         self._max_disk_size = max_disk_size
 
-        for stick in self.sticks:
-            if not stick.check():
-                raise Exception(f"Not acceptable stick state: {stick}")
+        # Lazily built indexes of the sticks by the sizes of the disks
+        self._stick_indexes: tuple[int] = None
+
+        """The moves keep the sticks acceptable (the operators are applicable
+        only on top of a bigger disk and `Stick.append` refuses any other
+        move), so only the states not created by a move are checked. The
+        sticks have to be numbered from 1 in order, as the operators address
+        them by their numbers as indexes."""
+        if parent is None:
+            for index, stick in enumerate(self._sticks):
+                if stick.stick_number != index + 1:
+                    raise HanoiError(
+                        f"Stick {stick} is not numbered {index + 1}")
+                if not stick.check():
+                    raise HanoiError(f"Not acceptable stick state: {stick}")
 
     @property
     def sticks(self) -> tuple[Stick]:
@@ -132,18 +147,78 @@ class HanoiState(State):
         """"""
         return self._max_disk_size
 
+    @property
+    def stick_indexes(self) -> tuple[int]:
+        """Indexes of the sticks the disks are on by the sizes of the disks
+        (-1 for the sizes of no disk). Built once the state is complete."""
+        if self._stick_indexes is None:
+            indexes = [-1] * self._max_disk_size
+            for index, stick in enumerate(self._sticks):
+                for size in stick.disks:
+                    indexes[size] = index
+            self._stick_indexes = tuple(indexes)
+        return self._stick_indexes
+
     def stick_index_by_disk(self, size: int) -> int:
         """"""
-        for index, stick in enumerate(self.sticks):
-            if stick.has_disk_of_size(size):
-                return index
-        raise Exception(f"No disk of the {size=}")
+        indexes = self.stick_indexes
+        if 0 < size < len(indexes) and indexes[size] >= 0:
+            return indexes[size]
+        raise HanoiError(f"No disk of the {size=}")
+
+    def stick_index(self, stick_number: int) -> int:
+        """Index of the stick of the given number in the sticks; the sticks
+        are numbered from 1 in order (checked when the state is created)."""
+        if 0 < stick_number <= self._num_of_sticks:
+            return stick_number - 1
+        raise HanoiError(f"No stick with number {stick_number}")
 
     def stick(self, stick_number: int):
-        for stick in self.sticks:
-            if stick.stick_number == stick_number:
-                return stick
-        raise Exception(f"No stick with number {stick_number}")
+        return self._sticks[self.stick_index(stick_number)]
+
+    def applicability_key(self) -> tuple[int]:
+        """The moves applicable depend only on the sizes of the disks on top
+        of the sticks (zero for the empty sticks)."""
+        return tuple([stick.size_of_top() if stick.has_any else 0
+                      for stick in self._sticks])
+
+    def _create_signature(self) -> "bytes | str":
+        """Indexes of the sticks by the sizes of the disks (see
+        `stick_indexes`) shifted by one, so the missing sizes are zeros, as
+        bytes. The disks on a stick are always ordered by their sizes, so the
+        stick of each disk is all it takes to tell the states apart.
+
+        When there are too many sticks for bytes, the sizes of the disks on
+        each of the sticks (sticks separated by '|') are used. The string is
+        interned, so the equal states share it and its hash is calculated
+        only once."""
+        if self._num_of_sticks < 255:
+            return bytes([index + 1 for index in self.stick_indexes])
+        return intern("|".join(
+            ",".join(map(str, stick.disks))
+            for stick in self.sticks))
+
+    def move_disk(self, from_index: int, to_index: int,
+                  operator: "Operator") -> "HanoiState":
+        """Returns the child state with the disk on top of the stick of the
+        first index moved on top of the other one. Only the two sticks are
+        cloned; the others are never changed, so the child shares them."""
+        sticks = self._sticks.copy()
+        from_stick = sticks[from_index] = sticks[from_index].clone()
+        to_stick = sticks[to_index] = sticks[to_index].clone()
+        size = from_stick.pop()
+        to_stick.append(size)
+
+        state = HanoiState(self._diff_evaluator, sticks, self._max_disk_size,
+                           self, operator)
+
+        # The indexes of the sticks by disks differ by the moved one only
+        stick_indexes = self._stick_indexes
+        if stick_indexes is not None:
+            stick_indexes = list(stick_indexes)
+            stick_indexes[size] = to_index
+            state._stick_indexes = tuple(stick_indexes)
+        return state
 
     def clone(self) -> "HanoiState":
         sticks = []
@@ -159,13 +234,20 @@ class HanoiState(State):
 class HanoiOperator(Operator):
     """"""
 
+    __slots__ = ("_from_stick", "_to_stick", "_from_index", "_to_index")
+
     def __init__(self, operator_name: str, from_stick: int, to_stick: int):
         Operator.__init__(self, operator_name)
         self._from_stick = from_stick
         self._to_stick = to_stick
 
-        if from_stick < 0 or to_stick < 0:
-            raise Exception(f"HanoiOperator error")
+        if from_stick < 1 or to_stick < 1:
+            raise HanoiError(
+                f"Stick numbers have to be positive: {from_stick}, {to_stick}")
+
+        # The sticks are numbered from 1 in order (see `HanoiState`)
+        self._from_index = from_stick - 1
+        self._to_index = to_stick - 1
 
     @property
     def from_stick(self) -> int:
@@ -177,30 +259,22 @@ class HanoiOperator(Operator):
 
     def can_be_applied_on(self, state: HanoiState) -> bool:
         """"""
-        if not state.stick(self.from_stick).has_any:
+        from_disks = state._sticks[self._from_index]._disks
+        to_disks = state._sticks[self._to_index]._disks
+        if not from_disks:
             return False
-        elif not state.stick(self.to_stick).has_any:
-            return True
-        else:
-            return (state.stick(self.from_stick).size_of_top() <
-                    state.stick(self.to_stick).size_of_top())
+        return not to_disks or from_disks[-1] < to_disks[-1]
 
     def apply_on(self, state: HanoiState) -> "HanoiState":
         """"""
-        if self.can_be_applied_on(state):
-
-            new_state = state.clone()
+        if not self.can_be_applied_on(state):
+            raise HanoiError(f"Cannot apply '{self}' on {state}")
+        return state.move_disk(self._from_index, self._to_index, self)
 
-            from_stick = new_state.stick(self.from_stick)
-            to_stick = new_state.stick(self.to_stick)
-            to_stick.append(from_stick.pop())
-
-            new_state.parent_state = state
-            new_state.applied_operator = self
-
-            return new_state
-        else:
-            raise Exception(f"Cannot apply '{self}' on {state}")
+    def _apply_unchecked_on(self, state: HanoiState) -> "HanoiState":
+        """The expansion applies only the operators already checked by
+        `can_be_applied_on`, so the disk is moved without the second check."""
+        return state.move_disk(self._from_index, self._to_index, self)
 
     def __repr__(self):
         return f"{self.from_stick}->{self.to_stick}"
@@ -209,6 +283,13 @@ class HanoiOperator(Operator):
 class HanoiEvaluator(DifferenceEvaluator):
     """"""
 
+    __slots__ = ()
+
+    @property
+    def integer_differences(self) -> bool:
+        """The difference is always 0 or 1."""
+        return True
+
     def evaluate_difference(
             self, state1: "HanoiState", state2: "HanoiState") -> float:
         """"""
@@ -225,7 +306,7 @@ class HanoiEvaluator(DifferenceEvaluator):
             for dn in range(len(st1)):
 
                 # If sizes of disks with this indexes are not equal
-                if st1.disks[dn].size != st2.disks[dn].size:
+                if st1.disks[dn] != st2.disks[dn]:
                     return 1
         return 0
 
@@ -233,12 +314,21 @@ class HanoiEvaluator(DifferenceEvaluator):
 class HanoiFloatEvaluator(DifferenceEvaluator):
     """"""
 
+    __slots__ = ()
+
+    @property
+    def integer_differences(self) -> bool:
+        """Counts of the misplaced disks are always integers."""
+        return True
+
     def evaluate_difference(self, s1: "HanoiState", s2: "HanoiState") -> float:
         """"""
+        # Disks (by sizes) placed on different sticks
+        indexes1 = s1.stick_indexes
+        indexes2 = s2.stick_indexes
         diff = 0
         for disk_size in range(1, s1.max_disk_size):
-            if (s1.stick_index_by_disk(disk_size) !=
-                    s2.stick_index_by_disk(disk_size)):
+            if indexes1[disk_size] != indexes2[disk_size]:
                 diff += 1
         return diff
 
@@ -248,18 +338,21 @@ def init(n_disks: int = 3, n_sticks: int = 3):
     #evaluator = HanoiEvaluator()
     evaluator = HanoiFloatEvaluator()
 
-    operators = []
-
-    for from_stick in range(1, n_sticks + 1):
-        for to_stick in range(1, n_sticks + 1):
-            if from_stick != to_stick:
-                operators.append(HanoiOperator(
-                    f"{from_stick}->{to_stick}", from_stick, to_stick))
-
     start = state_gen(n_disks + 1, n_sticks + 1, evaluator, 0)
     end = state_gen(n_disks + 1, n_sticks + 1, evaluator, 2)
 
-    return GoalOrientedStateSpace(start, operators, evaluator, end)
+    return GoalOrientedStateSpace(start, operators(n_sticks), evaluator, end)
+
+
+@lru_cache(maxsize=None)
+def operators(n_sticks: int) -> tuple[HanoiOperator]:
+    """Moves between each two of the sticks; the operators never change, so
+    they are built only once for each number of sticks."""
+    return tuple(HanoiOperator(f"{from_stick}->{to_stick}",
+                               from_stick, to_stick)
+                 for from_stick in range(1, n_sticks + 1)
+                 for to_stick in range(1, n_sticks + 1)
+                 if from_stick != to_stick)
 
 
 def state_gen(n_d: int, n_s: int, eva: DifferenceEvaluator, all_at: int):
@@ -270,51 +363,52 @@ def state_gen(n_d: int, n_s: int, eva: DifferenceEvaluator, all_at: int):
         sticks.append(Stick(stick))
 
     for disk in reversed(range(1, n_d)):
-        sticks[all_at].append(Disk(disk))
+        sticks[all_at].append(disk)
 
     return HanoiState(eva, sticks, n_d, None, None)
 
 
 # algo = RandomOperatorPicker(init(8))
 
-disks = 5
-sticks = 3
+if __name__ == "__main__":
+    disks = 5
+    sticks = 3
 
-algos = [
-    #RandomOperatorPicker(init(disks, sticks)),
-    #GOBFS(init(disks, sticks)),
-    #GODFS(init(disks, sticks)),
-    #GOIDDFS(init(disks, sticks), depth_increment=2),
-    #GOBestFirstSearch(init(disks, sticks)),
-    GOAStar(init(disks, sticks))
-]
+    algos = [
+        #RandomOperatorPicker(init(disks, sticks)),
+        #GOBFS(init(disks, sticks)),
+        #GODFS(init(disks, sticks)),
+        #GOIDDFS(init(disks, sticks), depth_increment=2),
+        #GOBestFirstSearch(init(disks, sticks)),
+        GOAStar(init(disks, sticks))
+    ]
 
-import time
+    import time
 
-start_time = None
-end_time = None
+    start_time = None
+    end_time = None
 
-results = []
+    results = []
 
-print(init(disks, sticks).initial_state)
+    print(init(disks, sticks).initial_state)
 
-for algo in algos:
-    try:
-        start_time = time.time()
-        algo.solve()
-    except SolutionSuccess as success:
-        end_time = time.time()
-        print(success.algorithm.algorithm_name)
-        ops = success.final_state.operators_sequence
-        print(len(ops), ":", ops)
+    for algo in algos:
+        try:
+            start_time = time.time()
+            algo.solve()
+        except SolutionSuccess as success:
+            end_time = time.time()
+            print(success.algorithm.algorithm_name)
+            ops = success.final_state.operators_sequence
+            print(len(ops), ":", ops)
 
-        print("Execution time:", end_time - start_time, "seconds")
+            print("Execution time:", end_time - start_time, "seconds")
 
-        results.append(
-            (success.algorithm.algorithm_name, f"{len(ops)}",
-             f"{end_time-start_time} s"))
+            results.append(
+                (success.algorithm.algorithm_name, f"{len(ops)}",
+                 f"{end_time-start_time} s"))
 
-        print(50*"-", "\n")
+            print(50*"-", "\n")
 
-for r in results:
-    print(f"{r[0]:55} {r[1]} operators used in {r[2]}")
+    for r in results:
+        print(f"{r[0]:55} {r[1]} operators used in {r[2]}")
@@ -0,0 +1,108 @@
+"""Tests of the results of the search algorithms."""
+
+import unittest
+from random import Random
+
+from src.algorithms.goal_oriented_a_star import GOAStar
+from src.algorithms.goal_oriented_best_first import GOBestFirstSearch
+from src.algorithms.goal_oriented_bfs import GOBFS
+from src.algorithms.goal_oriented_iddfs import GOIDDFS
+from src.fw import (GoalOrientedStateSpace, StateSpaceShuffle,
+                    HeapPriorityQueue, SolutionFailure)
+from src.problems import eight_puzzle
+from tests.test_state import CounterState, AddOperator, CounterEvaluator
+
+
+class ScaledCounterEvaluator(CounterEvaluator):
+    """Integer differences too big for the bucket queue."""
+
+    __slots__ = ()
+
+    @property
+    def integer_differences(self) -> bool:
+        return True
+
+    def evaluate_difference(self, state1: CounterState,
+                            state2: CounterState) -> float:
+        return 1000 * CounterEvaluator.evaluate_difference(
+            self, state1, state2)
+
+
+def counter_space(goal: int, evaluator=CounterEvaluator()
+                  ) -> GoalOrientedStateSpace:
+    """Counting from zero up to the limit of ten by ones and threes."""
+    return GoalOrientedStateSpace(
+        CounterState(0), (AddOperator(1), AddOperator(3)), evaluator,
+        CounterState(goal))
+
+
+class EightPuzzleTest(unittest.TestCase):
+
+    def test_a_star_finds_shortest_paths(self):
+        evaluator = eight_puzzle.ManhattanEvaluator()
+        for seed in range(6):
+            shuffler = StateSpaceShuffle(
+                eight_puzzle.ordered_state(evaluator),
+                eight_puzzle.operators(), evaluator, 60, rng=Random(seed))
+            state_space = shuffler.shuffle()
+            initial_state = state_space.initial_state
+            goal_state = state_space.goal_state
+
+            a_star = GOAStar(eight_puzzle.state_space_gen(
+                initial_state, goal_state)).search()
+            bfs = GOBFS(eight_puzzle.state_space_gen(
+                initial_state, goal_state)).search()
+
+            with self.subTest(seed=seed):
+                self.assertTrue(a_star.success)
+                self.assertTrue(bfs.success)
+                self.assertEqual(bfs.final_state.depth,
+                                 a_star.final_state.depth)
+                self.assertEqual(goal_state.signature(),
+                                 a_star.final_state.signature())
+
+    def test_seeded_shuffles_are_replayed(self):
+        evaluator = eight_puzzle.ManhattanEvaluator()
+        initial_states = [
+            StateSpaceShuffle(eight_puzzle.ordered_state(evaluator),
+                              eight_puzzle.operators(), evaluator, 30,
+                              rng=Random(42)).shuffle().initial_state
+            for _ in range(2)]
+        self.assertEqual(initial_states[0].signature(),
+                         initial_states[1].signature())
+
+
+class BestFirstSearchTest(unittest.TestCase):
+
+    def test_fringe_migrates_to_heap(self):
+        algorithm = GOBestFirstSearch(
+            counter_space(7, ScaledCounterEvaluator()))
+        result = algorithm.search()
+        self.assertTrue(result.success)
+        self.assertEqual(7, result.final_state.value)
+        self.assertIsInstance(algorithm._fringe, HeapPriorityQueue)
+
+    def test_cached_differences_follow_the_goal(self):
+        state_space = counter_space(7)
+        algorithm = GOBestFirstSearch(state_space)
+        self.assertEqual(4, algorithm.difference_from_goal(CounterState(3)))
+        state_space._goal_state = CounterState(5)
+        self.assertEqual(2, algorithm.difference_from_goal(CounterState(3)))
+
+
+class IDDFSTest(unittest.TestCase):
+
+    def test_finds_reachable_goal(self):
+        result = GOIDDFS(counter_space(8), depth_increment=2).search()
+        self.assertTrue(result.success)
+        self.assertEqual(8, result.final_state.value)
+
+    def test_terminates_on_finite_space(self):
+        algorithm = GOIDDFS(counter_space(11), depth_increment=2)
+        with self.assertRaises(SolutionFailure):
+            algorithm.solve()
+        self.assertFalse(GOIDDFS(counter_space(11)).search())
+
+
+if __name__ == "__main__":
+    unittest.main()
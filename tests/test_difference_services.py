@@ -0,0 +1,56 @@
+"""Tests of the basic metrics of the difference services."""
+
+import unittest
+
+from src.fw import difference_services
+from src.fw.difference_services import (
+    BitHammingDistance, HammingDistance, ManhattanDistance, EuclideanDistance)
+
+
+class AreTheSameTest(unittest.TestCase):
+
+    def test_agrees_with_evaluation(self):
+        for distance in (HammingDistance(), ManhattanDistance(),
+                         EuclideanDistance()):
+            for vector1, vector2 in (((1, 2), [1, 2]), ((1, 2), (1, 3)),
+                                     ((1, 2), range(1, 3))):
+                with self.subTest(distance=distance, vector2=vector2):
+                    self.assertEqual(
+                        distance.evaluate(vector1, tuple(vector2)) == 0,
+                        distance.are_the_same(vector1, vector2))
+
+    def test_refuses_different_dimensions(self):
+        for distance in (HammingDistance(), ManhattanDistance(),
+                         EuclideanDistance(), BitHammingDistance()):
+            with self.subTest(distance=distance):
+                with self.assertRaises(Exception):
+                    distance.evaluate((1, 2), (1, 2, 3))
+                with self.assertRaises(Exception):
+                    distance.are_the_same((1, 2), (1, 2, 3))
+
+
+class BitHammingDistanceTest(unittest.TestCase):
+
+    def test_counts_different_bits_of_packed_vectors(self):
+        distance = BitHammingDistance()
+        vector1 = (True, False, True, True, False)
+        vector2 = (False, False, True, False, True)
+        self.assertEqual(
+            3, distance.evaluate(distance.pack(vector1),
+                                 distance.pack(vector2)))
+        self.assertEqual(HammingDistance().evaluate(vector1, vector2),
+                         distance.evaluate(distance.pack(vector1),
+                                           distance.pack(vector2)))
+
+    def test_falls_back_to_hamming_distance_for_sequences(self):
+        self.assertEqual(2, BitHammingDistance().evaluate("abc", "xbz"))
+
+    def test_bit_count_fallback_matches_bit_count(self):
+        # The fallback is used before Python 3.10
+        for number in (0, 1, 0b1011, 2 ** 70 - 1):
+            self.assertEqual(difference_services._bit_count(number),
+                             difference_services._binary_bit_count(number))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Tests of the 8-puzzle grids and moves."""
+
+import unittest
+
+from src.problems import eight_puzzle
+
+
+class DottedGrid(eight_puzzle.Grid):
+    """Grid with another value of the empty field."""
+
+    __slots__ = ()
+
+    _EMPTY = "."
+
+
+class GridTest(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = eight_puzzle.ManhattanEvaluator()
+
+    def test_successors_keep_the_grid_class(self):
+        grid = DottedGrid.from_board(
+            ("1", "2", "3", "4", ".", "5", "6", "7", "8"), self.evaluator)
+        children = [operator.apply_on(grid)
+                    for operator in eight_puzzle.operators()]
+        self.assertEqual(4, len(children))
+        for child in children:
+            self.assertIsInstance(child, DottedGrid)
+            self.assertEqual(child.signature(),
+                             DottedGrid.from_board(
+                                 child.board, self.evaluator).signature())
+        self.assertEqual(("1", "2", "3", "4", "5", ".", "6", "7", "8"),
+                         children[0].board)
+        self.assertIsInstance(children[0].clone(), DottedGrid)
+
+    def test_refuses_incomplete_boards(self):
+        Field = eight_puzzle.Field
+        fields = eight_puzzle.ordered_state(self.evaluator).fields
+        for wrong_fields in (
+                fields[:-1] + (Field("8", 3, 0),),
+                fields[:-1] + (Field("8", 0, 3),),
+                fields[:-1] + (Field("8", 1, 0),),
+                fields[:-1] + (Field("7", 2, 2),),
+                fields[1:] + (Field("9", 0, 0),)):
+            with self.subTest(fields=wrong_fields):
+                with self.assertRaises(eight_puzzle.GridError):
+                    eight_puzzle.Grid(wrong_fields, self.evaluator)
+
+        for wrong_board in ("12345678", "_1234567", "_12345677", "123456789"):
+            with self.subTest(board=wrong_board):
+                with self.assertRaises(eight_puzzle.GridError):
+                    eight_puzzle.Grid.from_board(tuple(wrong_board),
+                                                 self.evaluator)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests of the Hanoi towers states and moves."""
+
+import unittest
+
+from src.fw.state import OperatorApplicationError
+from src.problems import hanoi
+
+
+class HanoiStateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = hanoi.HanoiFloatEvaluator()
+
+    def test_sticks_are_numbered_in_order(self):
+        state = hanoi.state_gen(4, 4, self.evaluator, 0)
+        self.assertEqual([0, 1, 2],
+                         [state.stick_index(number) for number in (1, 2, 3)])
+        with self.assertRaises(hanoi.HanoiError):
+            state.stick_index(4)
+
+    def test_refuses_sticks_numbered_otherwise(self):
+        sticks = [hanoi.Stick(2), hanoi.Stick(1), hanoi.Stick(3)]
+        with self.assertRaises(hanoi.HanoiError):
+            hanoi.HanoiState(self.evaluator, sticks, 1)
+
+    def test_move_disk_refuses_illegal_moves(self):
+        state = hanoi.state_gen(4, 4, self.evaluator, 0)
+        child = state.move_disk(0, 1, None)
+        with self.assertRaises(hanoi.HanoiError):
+            child.move_disk(0, 1, None)
+        with self.assertRaises(hanoi.HanoiError):
+            child.move_disk(2, 0, None)
+        self.assertEqual(((3, 2), (1,), ()),
+                         tuple(stick.disks for stick in child.sticks))
+
+
+class HanoiOperatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.state_space = hanoi.init(3, 3)
+        self.operators = {repr(operator): operator
+                          for operator in self.state_space.operators}
+
+    def test_refuses_disk_on_smaller_one(self):
+        operator = self.operators["1->2"]
+        state = operator.apply_on(self.state_space.initial_state)
+        self.assertFalse(operator.can_be_applied_on(state))
+        with self.assertRaises(hanoi.HanoiError):
+            operator.apply_on(state)
+        with self.assertRaises(OperatorApplicationError):
+            state.apply(operator)
+
+    def test_refuses_move_from_empty_stick(self):
+        with self.assertRaises(hanoi.HanoiError):
+            self.operators["3->1"].apply_on(self.state_space.initial_state)
+
+    def test_expansion_moves_legally(self):
+        initial_state = self.state_space.initial_state
+        children = self.state_space.expand(initial_state)
+        self.assertEqual(["1->2", "1->3"],
+                         [repr(child.applied_operator) for child in children])
+        for child in children:
+            self.assertTrue(all(stick.check() for stick in child.sticks))
+            self.assertEqual((3, 2), child.stick(1).disks)
+
+
+if __name__ == "__main__":
+    unittest.main()
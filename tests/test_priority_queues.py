@@ -0,0 +1,57 @@
+"""Tests of the priority queues the fringes are ordered by."""
+
+import unittest
+
+from src.fw import BucketPriorityQueue, HeapPriorityQueue
+
+
+class HeapPriorityQueueTest(unittest.TestCase):
+
+    def test_pops_by_priority(self):
+        queue = HeapPriorityQueue()
+        for priority, item in ((3, "c"), (1.5, "a"), (2, "b")):
+            queue.push(priority, item)
+        self.assertEqual(["a", "b", "c"],
+                         [queue.pop() for _ in range(len(queue))])
+
+    def test_ties_are_fifo(self):
+        queue = HeapPriorityQueue([(1, "first"), (0, "zero")])
+        queue.push(1, "second")
+        queue.push(1, "third")
+        self.assertEqual(["zero", "first", "second", "third"],
+                         [queue.pop() for _ in range(len(queue))])
+
+
+class BucketPriorityQueueTest(unittest.TestCase):
+
+    def test_ties_are_fifo(self):
+        queue = BucketPriorityQueue()
+        for priority, item in ((2, "c"), (1, "a"), (2, "d"), (1, "b")):
+            queue.push(priority, item)
+        self.assertEqual(["a", "b", "c", "d"],
+                         [queue.pop() for _ in range(len(queue))])
+
+    def test_entries_migrate_to_heap_in_order(self):
+        queue = BucketPriorityQueue()
+        for priority, item in ((2, "c"), (1, "a"), (2, "d"), (1, "b")):
+            queue.push(priority, item)
+        heap = HeapPriorityQueue(queue.entries())
+        heap.push(1, "e")
+        self.assertEqual(["a", "b", "e", "c", "d"],
+                         [heap.pop() for _ in range(len(heap))])
+
+    def test_refuses_no_bucket_index(self):
+        queue = BucketPriorityQueue()
+        for priority in (BucketPriorityQueue.MAX_PRIORITY + 1, -1, 0.5):
+            with self.assertRaises(TypeError):
+                queue.push(priority, "item")
+        queue.push(BucketPriorityQueue.MAX_PRIORITY, "item")
+        self.assertEqual(1, len(queue))
+
+    def test_pop_from_empty(self):
+        with self.assertRaises(IndexError):
+            BucketPriorityQueue().pop()
+
+
+if __name__ == "__main__":
+    unittest.main()
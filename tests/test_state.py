@@ -0,0 +1,105 @@
+"""Tests of the paths of the states and their replays."""
+
+import unittest
+
+from src.fw import State, Operator, DifferenceEvaluator
+from src.fw.state import OperatorApplicationError
+
+
+class CounterState(State):
+    """State of a bounded counter."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: int, parent: State = None,
+                 applied_operator: Operator = None):
+        State.__init__(self, CounterEvaluator(), parent, applied_operator)
+        self._value = value
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def _create_signature(self) -> int:
+        return self._value
+
+
+class AddOperator(Operator):
+    """Adds a number to the counter, which cannot exceed the limit."""
+
+    __slots__ = ("_number", "_limit")
+
+    def __init__(self, number: int, limit: int = 10):
+        Operator.__init__(self, f"+{number}")
+        self._number = number
+        self._limit = limit
+
+    def can_be_applied_on(self, state: CounterState) -> bool:
+        return state.value + self._number <= self._limit
+
+    def apply_on(self, state: CounterState) -> CounterState:
+        return CounterState(state.value + self._number, state, self)
+
+
+class CounterEvaluator(DifferenceEvaluator):
+
+    __slots__ = ()
+
+    def evaluate_difference(self, state1: CounterState,
+                            state2: CounterState) -> float:
+        return abs(state1.value - state2.value)
+
+
+class PathTest(unittest.TestCase):
+
+    def setUp(self):
+        self.add_one = AddOperator(1)
+        self.add_three = AddOperator(3)
+        self.root = CounterState(0)
+        self.leaf = self.root.apply(self.add_three).apply(
+            self.add_one).apply(self.add_three)
+
+    def test_depth_and_sequences(self):
+        self.assertEqual(3, self.leaf.depth)
+        self.assertEqual((self.add_three, self.add_one, self.add_three),
+                         self.leaf.operators_sequence)
+        self.assertEqual([0, 3, 4, 7], [state.value for state
+                                        in self.leaf.parents_sequence])
+        self.assertIs(self.root, self.leaf.parents_sequence[0])
+        self.assertIs(self.leaf, self.leaf.parents_sequence[-1])
+
+    def test_iterators_up(self):
+        self.assertEqual([self.add_three, self.add_one, self.add_three],
+                         list(self.leaf.iter_operators_up()))
+        self.assertEqual(list(reversed(self.leaf.parents_sequence)),
+                         list(self.leaf.iter_ancestors_up()))
+        self.assertEqual([], list(self.root.iter_operators_up()))
+        self.assertEqual([self.root], list(self.root.iter_ancestors_up()))
+
+    def test_operators_sequence_leaf_to_root(self):
+        self.assertEqual((self.add_three, self.add_one, self.add_three),
+                         self.leaf.operators_sequence_leaf_to_root)
+        leaf = self.leaf.apply(self.add_one)
+        self.assertEqual(tuple(reversed(leaf.operators_sequence)),
+                         leaf.operators_sequence_leaf_to_root)
+        self.assertEqual((), self.root.operators_sequence_leaf_to_root)
+
+    def test_solution_replay_from_the_root(self):
+        replayed = list(self.leaf.solution_replay())
+        self.assertEqual([3, 4, 7], [state.value for state in replayed])
+        self.assertEqual(self.leaf.signature(), replayed[-1].signature())
+
+    def test_solution_replay_from_another_state(self):
+        replayed = list(self.leaf.solution_replay(CounterState(2)))
+        self.assertEqual([5, 6, 9], [state.value for state in replayed])
+
+    def test_solution_replay_of_the_root_is_empty(self):
+        self.assertEqual([], list(self.root.solution_replay()))
+
+    def test_solution_replay_of_inapplicable_path(self):
+        with self.assertRaises(OperatorApplicationError):
+            list(self.leaf.solution_replay(CounterState(5)))
+
+
+if __name__ == "__main__":
+    unittest.main()